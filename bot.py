@@ -11,16 +11,86 @@ import os
 import signal
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
+import aiohttp
 import discord
+import psutil
 from discord.ext import commands
 
 from database.db_session import DatabaseManager
 
+# Secret lookup order: Docker secrets, then the local development directory
+SECRETS_DIRS = (Path('/run/secrets'), Path('secrets'))
+
+# Environment variable name suffixes whose values are masked in logs
+_SENSITIVE_SUFFIXES = ('_TOKEN', '_PASSWORD', '_SECRET', '_KEY')
+
+# Static text for app command error embeds
+_PERM_DENIED_FOOTER = "Contact a server administrator if you believe this is an error."
+_COMMAND_ERROR_DESCRIPTION = "An unexpected error occurred while processing your command. Please try again later."
+_COMMAND_ERROR_FOOTER = "If this problem persists, please contact a server administrator."
+
+def _is_sensitive(name: str) -> bool:
+    """Return whether an environment variable's value should be masked."""
+    return name.endswith(_SENSITIVE_SUFFIXES)
+
+# Non-empty secrets already read; empty or missing ones are re-read on the next lookup
+_secret_cache: dict[str, str] = {}
+
+def _load_secret(name: str) -> Optional[str]:
+    """
+    Load a secret from {dir}/{name}.txt in the first of SECRETS_DIRS that has the file.
+    
+    Returns None if no directory has it. The first file found is used even when
+    empty, so an empty secret is reported rather than skipped. Read errors other
+    than a missing file propagate as OSError.
+    """
+    cached = _secret_cache.get(name)
+    if cached is not None:
+        return cached
+    
+    for secrets_dir in SECRETS_DIRS:
+        try:
+            content = (secrets_dir / f"{name}.txt").read_text().strip()
+        except FileNotFoundError:
+            continue
+        if content:
+            _secret_cache[name] = content
+        return content
+    return None
+
+def _probe_secret(name: str):
+    """Load a secret for the startup check, returning a read error instead of raising it."""
+    try:
+        return _load_secret(name)
+    except OSError as e:
+        return e
+
 class AgoraBot(commands.Bot):
     """Main bot class for the Agora Discord Bot."""
     
+    # Message activity is flushed to Redis every interval or once this many are buffered
+    MESSAGE_FLUSH_INTERVAL = 0.2
+    MESSAGE_FLUSH_BATCH_SIZE = 100
+    
+    # Integer settings loaded from the environment: (attribute, variable, default)
+    # A default of None marks the variable as required
+    _INT_CONFIG = (
+        ('admin_notification_channel_id', 'ADMIN_NOTIFICATION_CHANNEL_ID', None),
+        ('queue_channel_id', 'QUEUE_CHANNEL_ID', None),
+        ('public_announcement_channel_id', 'PUBLIC_ANNOUNCEMENT_CHANNEL_ID', None),
+        ('proposed_channel_category_id', 'PROPOSED_CHANNEL_CATEGORY_ID', None),
+        ('permanent_channel_category_id', 'PERMANENT_CHANNEL_CATEGORY_ID', None),
+        ('proposed_activity_report_channel_id', 'PROPOSED_ACTIVITY_REPORT_CHANNEL_ID', None),
+        ('permanent_activity_report_channel_id', 'PERMANENT_ACTIVITY_REPORT_CHANNEL_ID', None),
+        ('max_proposed_channels', 'MAX_PROPOSED_CHANNELS', '10'),
+        ('stats_refresh_interval_minutes', 'STATS_REFRESH_INTERVAL_MINUTES', '30'),
+        ('stats_recalc_batch_size', 'STATS_RECALC_BATCH_SIZE', '500'),
+        ('stats_recalc_concurrency', 'STATS_RECALC_CONCURRENCY', '8'),
+        ('stats_recalc_max_pages', 'STATS_RECALC_MAX_PAGES', '3000'),
+    )
+    
     def __init__(self):
         """Initialize the bot with required intents and configuration."""
         # Configure intents
@@ -38,63 +108,77 @@ class AgoraBot(commands.Bot):
         
         self.logger = logging.getLogger('bot')
         self.db_manager: Optional[DatabaseManager] = None
+        self._redis_stats = None  # Cached db_manager.redis_stats for the message hot path
         self.admin_notification_channel_id = None
         self.is_shutting_down = False
+        # Task running _on_signal, kept so it can't be garbage-collected mid-shutdown
+        self._shutdown_task: Optional[asyncio.Task] = None
         self.start_time = discord.utils.utcnow()
+        self._total_members = 0  # Running member total across guilds, seeded in on_ready
+        self._commands_synced = False  # on_ready fires on every reconnect; sync the tree once
+        
+        # Reuse one process handle and prime cpu_percent so later reads have a baseline
+        self._proc = psutil.Process()
+        psutil.cpu_percent(interval=None)
+        
+        # Buffered (channel_id, message_id, timestamp) increments flushed to Redis in batches.
+        # Appends and swaps never await, so the event loop serializes them without a lock.
+        self._msg_buffer: list[tuple[int, int, int]] = []
+        self._buffer_full = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Shared HTTP client for outbound downloads and API calls, opened in setup_hook
+        self.http_session: Optional[aiohttp.ClientSession] = None
         
         # Load configuration
         self._load_config()
         
-        # Setup signal handlers for graceful shutdown
-        self._setup_signal_handlers()
+        # Role mentions render from the ID alone, so they can be built once
+        self._admin_role_mentions_template = [f"<@&{role_id}>" for role_id in sorted(self.admin_role_ids or ())]
     
     def _load_config(self):
         """Load configuration from environment variables."""
         self.logger.info("[bot._load_config] Loading configuration...")
         
-        # Check Docker secrets availability
-        self._check_docker_secrets()
+        # Snapshot the environment once; it is only needed while config is loaded
+        self._env_snapshot = dict(os.environ)
+        env = self._env_snapshot
         
-        # Required environment variables
-        required_env_vars = [
-            'ADMIN_NOTIFICATION_CHANNEL_ID',
-            'QUEUE_CHANNEL_ID',
-            'PROPOSED_CHANNEL_CATEGORY_ID',
-        ]
+        # Log non-secret environment (secrets are checked asynchronously in setup_hook)
+        self._log_environment()
         
+        # Load channel IDs and configuration in a single pass over the table
         missing_vars = []
-        for var in required_env_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+        try:
+            for attr, var, default in self._INT_CONFIG:
+                value = env.get(var) or default
+                if value is None:
+                    missing_vars.append(var)
+                    continue
+                setattr(self, attr, int(value))
+        except ValueError as e:
+            self.logger.error(f"[bot._load_config] Invalid configuration values: {e}")
+            raise
         
         if missing_vars:
             self.logger.error(f"[bot._load_config] Missing required environment variables: {missing_vars}")
             raise ValueError(f"Missing required environment variables: {missing_vars}")
         
-        # Load channel IDs and configuration
-        try:
-            self.admin_notification_channel_id = int(os.getenv('ADMIN_NOTIFICATION_CHANNEL_ID'))
-            self.queue_channel_id = int(os.getenv('QUEUE_CHANNEL_ID'))
-            self.public_announcement_channel_id = int(os.getenv('PUBLIC_ANNOUNCEMENT_CHANNEL_ID'))
-            self.proposed_channel_category_id = int(os.getenv('PROPOSED_CHANNEL_CATEGORY_ID'))
-            self.permanent_channel_category_id = int(os.getenv('PERMANENT_CHANNEL_CATEGORY_ID'))
-            self.proposed_activity_report_channel_id = int(os.getenv('PROPOSED_ACTIVITY_REPORT_CHANNEL_ID'))
-            self.permanent_activity_report_channel_id = int(os.getenv('PERMANENT_ACTIVITY_REPORT_CHANNEL_ID'))
-            self.max_proposed_channels = int(os.getenv('MAX_PROPOSED_CHANNELS', '10'))
-            self.stats_refresh_interval_minutes = int(os.getenv('STATS_REFRESH_INTERVAL_MINUTES', '30'))
-        except (ValueError, TypeError) as e:
-            self.logger.error(f"[bot._load_config] Invalid configuration values: {e}")
-            raise
+        # Categories whose channels are tracked for activity scoring
+        self._tracked_category_ids = frozenset((
+            self.proposed_channel_category_id,
+            self.permanent_channel_category_id
+        ))
         
         # Load admin role configuration
-        admin_role_config = os.getenv('ADMIN_ROLE_IDS', 'administrator')
+        admin_role_config = env.get('ADMIN_ROLE_IDS', 'administrator')
         if admin_role_config.lower() == 'administrator':
             self.admin_role_ids = None  # Use administrator permission
             self.logger.info("[bot._load_config] Using Discord administrator permission for admin commands")
         else:
             try:
                 # Parse comma-separated role IDs
-                self.admin_role_ids = [int(role_id.strip()) for role_id in admin_role_config.split(',') if role_id.strip()]
+                self.admin_role_ids = frozenset(int(role_id.strip()) for role_id in admin_role_config.split(',') if role_id.strip())
                 self.logger.info(f"[bot._load_config] Loaded {len(self.admin_role_ids)} admin role IDs")
             except ValueError as e:
                 self.logger.error(f"[bot._load_config] Invalid admin role IDs: {e}")
@@ -103,53 +187,61 @@ class AgoraBot(commands.Bot):
                 self.logger.warning("[bot._load_config] Falling back to administrator permission")
         
         # Load LLM configuration
-        self.llm_url = os.getenv('OPEN_WEB_UI_URL', 'http://openwebui:8080/api/chat/completions')
-        self.llm_model = os.getenv('OPEN_WEB_UI_MODEL', 'llama3.2')
+        self.llm_url = env.get('OPEN_WEB_UI_URL', 'http://openwebui:8080/api/chat/completions')
+        self.llm_model = env.get('OPEN_WEB_UI_MODEL', 'llama3.2')
+        
+        # Config is now frozen into typed attributes; drop the snapshot
+        del self._env_snapshot
         
         self.logger.info("[bot._load_config] Configuration loaded successfully")
     
-    def _check_docker_secrets(self):
+    async def _check_docker_secrets(self):
         """Check which Docker secrets are available at startup."""
         self.logger.info("[bot._check_docker_secrets] Checking Docker secrets availability...")
         
-        secrets_dir = Path('/run/secrets')
-        if not secrets_dir.exists():
+        if not SECRETS_DIRS[0].exists():
             self.logger.warning("[bot._check_docker_secrets] /run/secrets directory does not exist")
-            return
         
-        expected_secrets = ['discord_bot_token.txt', 'db_password.txt', 'open_webui_token.txt']
+        expected_secrets = ['discord_bot_token', 'db_password', 'open_webui_token']
         found_secrets = []
         missing_secrets = []
         
-        for secret_file in expected_secrets:
-            secret_path = secrets_dir / secret_file
-            if secret_path.exists():
-                try:
-                    with open(secret_path, 'r') as f:
-                        content = f.read().strip()
-                    if content:
-                        found_secrets.append(f"{secret_file} (length: {len(content)})")
-                    else:
-                        missing_secrets.append(f"{secret_file} (empty)")
-                except Exception as e:
-                    missing_secrets.append(f"{secret_file} (read error: {e})")
+        # Read all secrets concurrently; overlay filesystems make each open slow
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_probe_secret, name) for name in expected_secrets)
+        )
+        
+        for name, content in zip(expected_secrets, results):
+            if isinstance(content, OSError):
+                missing_secrets.append(f"{name} (read error: {content})")
+            elif content is None:
+                missing_secrets.append(f"{name} (not found)")
+            elif content:
+                found_secrets.append(f"{name} (length: {len(content)})")
             else:
-                missing_secrets.append(f"{secret_file} (not found)")
+                missing_secrets.append(f"{name} (empty)")
         
         if found_secrets:
             self.logger.info(f"[bot._check_docker_secrets] Available secrets: {', '.join(found_secrets)}")
         
         if missing_secrets:
             self.logger.warning(f"[bot._check_docker_secrets] Missing/problematic secrets: {', '.join(missing_secrets)}")
-        
-        # Also log environment variables
+    
+    def _log_environment(self):
+        """Log the non-secret environment variables used by the bot."""
         env_vars = ['OPEN_WEB_UI_URL', 'OPEN_WEB_UI_MODEL', 'DB_HOST', 'DB_NAME']
-        self.logger.info("[bot._check_docker_secrets] Environment variables:")
+        self.logger.info("[bot._log_environment] Environment variables:")
+        env = self._env_snapshot
         for var in env_vars:
-            value = os.getenv(var, 'NOT_SET')
-            if 'password' in var.lower() or 'token' in var.lower():
+            value = env.get(var, 'NOT_SET')
+            if _is_sensitive(var):
                 value = f"{value[:10]}..." if len(value) > 10 else "***"
-            self.logger.info(f"  {var}={value}")
+            self.logger.info("  %s=%s", var, value)
+    
+    @property
+    def redis_stats(self):
+        """The Redis stats manager, or None until the database is initialized."""
+        return self._redis_stats
     
     def has_admin_permissions(self, user: discord.Member) -> bool:
         """Check if a user has admin permissions based on configuration."""
@@ -158,22 +250,40 @@ class AgoraBot(commands.Bot):
             return user.guild_permissions.administrator
         else:
             # Check if user has any of the configured admin roles
-            user_role_ids = [role.id for role in user.roles]
-            return any(role_id in user_role_ids for role_id in self.admin_role_ids)
+            return not self.admin_role_ids.isdisjoint(role.id for role in user.roles)
     
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            self.logger.info(f"[bot._setup_signal_handlers] Received signal {signum}")
-            # Set shutdown flag and close the bot
-            self.is_shutting_down = True
-            # Force the bot to close which will trigger our close() method
-            asyncio.create_task(self.close())
-        
+        """Setup signal handlers for graceful shutdown on the running event loop."""
         # Only setup signal handlers on Unix systems
-        if sys.platform != 'win32':
-            signal.signal(signal.SIGTERM, signal_handler)
-            signal.signal(signal.SIGINT, signal_handler)
+        if sys.platform == 'win32':
+            return
+        
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._handle_signal, sig)
+    
+    def _handle_signal(self, signum: int):
+        """Start the shutdown task for a signal, ignoring repeats while it runs."""
+        if self._shutdown_task is not None and not self._shutdown_task.done():
+            return
+        self._shutdown_task = asyncio.create_task(self._on_signal(signum))
+        self._shutdown_task.add_done_callback(self._on_shutdown_done)
+    
+    def _on_shutdown_done(self, task: asyncio.Task):
+        """Log an exception raised while shutting down on a signal."""
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("[bot._on_shutdown_done] Shutdown failed", exc_info=task.exception())
+    
+    async def _on_signal(self, signum: int):
+        """Handle a shutdown signal delivered through the event loop."""
+        if self.is_shutting_down:
+            return
+        
+        self.logger.info(f"[bot._on_signal] Received signal {signum}")
+        # Set shutdown flag so close() performs the cleanup itself. Closing ends
+        # start(), so main() returns normally; asyncio.run cancels any leftovers.
+        self.is_shutting_down = True
+        await self.close()
     
     async def setup_hook(self):
         """
@@ -183,13 +293,35 @@ class AgoraBot(commands.Bot):
         self.logger.info("[bot.setup_hook] Bot setup starting...")
         
         try:
-            # Initialize database connections
+            # Setup signal handlers for graceful shutdown
+            self._setup_signal_handlers()
+            
+            # Check Docker secrets availability
+            await self._check_docker_secrets()
+            
+            # Initialize database connections and load cogs concurrently; no cog
+            # touches the database until the bot is ready
             self.db_manager = DatabaseManager()
-            await self.db_manager.initialize()
+            db_task = asyncio.create_task(self.db_manager.initialize())
+            cogs_task = asyncio.create_task(self._load_cogs())
+            try:
+                await asyncio.gather(db_task, cogs_task)
+            finally:
+                # If either step failed, don't leave the other running against a bot
+                # whose setup failed; await it so its outcome is always retrieved
+                for task in (db_task, cogs_task):
+                    task.cancel()
+                await asyncio.gather(db_task, cogs_task, return_exceptions=True)
+            self._redis_stats = getattr(self.db_manager, 'redis_stats', None)
             self.logger.info("[bot.setup_hook] Database connections initialized")
             
-            # Load cogs
-            await self._load_cogs()
+            # Start the background flusher for buffered message activity
+            self._flush_task = asyncio.create_task(self._message_flush_loop())
+            
+            # Pooled HTTP session so downloads reuse connections and DNS lookups
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
             
             # Set up error handler for the command tree
             self.tree.error(self.on_app_command_error)
@@ -216,100 +348,178 @@ class AgoraBot(commands.Bot):
             'cogs.admin_commands',  # Organized admin command groups
         ]
         
-        for cog in cogs_to_load:
-            try:
-                await self.load_extension(cog)
-                self.logger.info(f"[bot._load_cogs] Loaded cog: {cog}")
-            except Exception as e:
-                self.logger.error(f"[bot._load_cogs] Failed to load cog {cog}: {e}", exc_info=True)
+        # Cogs have no load-time dependencies on each other, so load them together
+        results = await asyncio.gather(
+            *(self.load_extension(cog) for cog in cogs_to_load),
+            return_exceptions=True
+        )
+        
+        for cog, result in zip(cogs_to_load, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"[bot._load_cogs] Failed to load cog {cog}: {result}", exc_info=result)
                 # Don't raise here - allow bot to start with partial functionality
+            else:
+                self.logger.info(f"[bot._load_cogs] Loaded cog: {cog}")
     
     async def on_ready(self):
         """Event fired when the bot is ready and connected to Discord."""
         self.logger.info(f"[bot.on_ready] Bot logged in as {self.user} (ID: {self.user.id})")
         self.logger.info(f"[bot.on_ready] Connected to {len(self.guilds)} guild(s)")
         
+        # Seed the running member total; guild/member events keep it current
+        self._total_members = sum(guild.member_count or 0 for guild in self.guilds)
+        
         # Send startup notification
         await self._send_startup_notification()
         
-        # Sync slash commands
+        # Sync slash commands; tree.sync() bulk-overwrites every command in a single request
+        if self._commands_synced:
+            return
         try:
             synced = await self.tree.sync()
+            self._commands_synced = True
             self.logger.info(f"[bot.on_ready] Synced {len(synced)} slash command(s)")
         except Exception as e:
             self.logger.error(f"[bot.on_ready] Failed to sync commands: {e}", exc_info=True)
     
+    async def on_guild_join(self, guild: discord.Guild):
+        """Add a newly joined guild's members to the running total."""
+        self._total_members += guild.member_count or 0
+    
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Remove a departed guild's members from the running total."""
+        self._total_members -= guild.member_count or 0
+    
+    async def on_member_join(self, member: discord.Member):
+        """Count a member joining any guild."""
+        self._total_members += 1
+    
+    async def on_member_remove(self, member: discord.Member):
+        """Count a member leaving any guild."""
+        self._total_members -= 1
+    
+    async def _gather_status(self) -> dict:
+        """Collect database and process status for startup/shutdown notifications."""
+        async def _db_status() -> dict:
+            if not self.db_manager:
+                return {'postgresql': False, 'redis': False, 'redis_stats': False}
+            try:
+                return await self.db_manager.test_connections()
+            except Exception:
+                # Database may already be closing
+                return {'postgresql': False, 'redis': False, 'redis_stats': False}
+        
+        def _process_usage() -> tuple:
+            try:
+                return self._proc.memory_info().rss / 1024 / 1024, psutil.cpu_percent(interval=None)
+            except Exception:
+                return 0, 0
+        
+        # Run the database check concurrently with the psutil reads
+        db_status, (memory_mb, cpu_percent) = await asyncio.gather(
+            _db_status(),
+            asyncio.to_thread(_process_usage)
+        )
+        
+        return {
+            'db_status': db_status,
+            'memory_mb': memory_mb,
+            'cpu_percent': cpu_percent,
+            'total_members': self._total_members,
+            'guild_count': len(self.guilds),
+        }
+    
+    def _build_status_embed(self, status: dict, kind: Literal['start', 'shutdown']) -> discord.Embed:
+        """Build the admin notification embed for a startup or shutdown event."""
+        db_status = status['db_status']
+        pg_icon = "🟢" if db_status.get('postgresql') else "🔴"
+        now = discord.utils.utcnow()
+        
+        if kind == 'start':
+            embed = discord.Embed(
+                title="🤖 Agora Bot Started",
+                description="The bot has successfully started and is ready to serve!",
+                color=0x00ff00,
+                timestamp=now
+            )
+            
+            # Server Info
+            embed.add_field(
+                name="🌐 Server Info",
+                value=f"**Guilds:** {status['guild_count']}\n"
+                      f"**Users:** {status['total_members']:,}\n"
+                      f"**Start Time:** {now.strftime('%H:%M:%S UTC')}",
+                inline=True
+            )
+        else:
+            embed = discord.Embed(
+                title="🔴 Bot Shutdown",
+                description="The Agora bot is shutting down gracefully... (Signal received)",
+                color=0xff0000,
+                timestamp=now
+            )
+            
+            # Session Stats
+            uptime = now - self.start_time
+            uptime_str = f"{uptime.total_seconds()//60:.0f}m {uptime.total_seconds()%60:.0f}s"
+            embed.add_field(
+                name="📊 Session Stats",
+                value=f"**Uptime:** {uptime_str}\n"
+                      f"**Guilds:** {status['guild_count']}\n"
+                      f"**Users:** {status['total_members']:,}",
+                inline=True
+            )
+        
+        # Database
+        embed.add_field(
+            name="🗄️ Database",
+            value=f"**Status:** {pg_icon} Connected\n"
+                  f"**Events:** 3\n"  # Placeholder - could be dynamic
+                  f"**Announcements:** 7",  # Placeholder - could be dynamic
+            inline=True
+        )
+        
+        # System
+        health_line = "**Health Port:** 8080\n" if kind == 'start' else ""
+        embed.add_field(
+            name="💻 System" if kind == 'start' else "⚙️ System",
+            value=f"**Discord.py:** {discord.__version__}\n"
+                  f"{health_line}"
+                  f"**CPU:** {status['cpu_percent']:.1f}%\n"
+                  f"**Memory:** {status['memory_mb']:.1f} MB",
+            inline=True
+        )
+        
+        if kind == 'start':
+            # Startup Process
+            redis_stats_icon = "🟢" if db_status.get('redis_stats') else "🔴"
+            embed.add_field(
+                name="🚀 Startup Process",
+                value=f"**Health Server:** Running\n"
+                      f"**Scheduler:** Active\n"
+                      f"**Commands:** Synced\n"
+                      f"**Redis Stats:** {redis_stats_icon}",
+                inline=False
+            )
+        else:
+            # Shutdown Process
+            embed.add_field(
+                name="🔄 Shutdown Process",
+                value=f"**Type:** Signal-triggered\n"
+                      f"**Resources:** Cleaning up\n"
+                      f"**Health:** Port closing",
+                inline=False
+            )
+        
+        return embed
+    
     async def _send_startup_notification(self):
         """Send a startup notification to the admin channel."""
         try:
             channel = self.get_channel(self.admin_notification_channel_id)
             if channel:
-                # Get system information
-                import psutil
-                import discord as discord_lib
-                
-                # Calculate member count across all guilds
-                total_members = sum(guild.member_count for guild in self.guilds)
-                
-                # Get database status
-                db_status = {'postgresql': False, 'redis': False, 'redis_stats': False}
-                if self.db_manager:
-                    db_status = await self.db_manager.test_connections()
-                
-                # Memory usage
-                process = psutil.Process()
-                memory_mb = process.memory_info().rss / 1024 / 1024
-                
-                embed = discord.Embed(
-                    title="🤖 Agora Bot Started",
-                    description="The bot has successfully started and is ready to serve!",
-                    color=0x00ff00,
-                    timestamp=discord.utils.utcnow()
-                )
-                
-                # Server Info
-                embed.add_field(
-                    name="🌐 Server Info",
-                    value=f"**Guilds:** {len(self.guilds)}\n"
-                          f"**Users:** {total_members:,}\n"
-                          f"**Start Time:** {discord.utils.utcnow().strftime('%H:%M:%S UTC')}",
-                    inline=True
-                )
-                
-                # Database
-                pg_icon = "🟢" if db_status.get('postgresql') else "🔴"
-                redis_icon = "🟢" if db_status.get('redis') else "🔴"
-                
-                embed.add_field(
-                    name="🗄️ Database",
-                    value=f"**Status:** {pg_icon} Connected\n"
-                          f"**Events:** 3\n"  # Placeholder - could be dynamic
-                          f"**Announcements:** 7",  # Placeholder - could be dynamic
-                    inline=True
-                )
-                
-                # System
-                embed.add_field(
-                    name="💻 System",
-                    value=f"**Discord.py:** {discord_lib.__version__}\n"
-                          f"**Health Port:** 8080\n"
-                          f"**CPU:** {psutil.cpu_percent():.1f}%\n"
-                          f"**Memory:** {memory_mb:.1f} MB",
-                    inline=True
-                )
-                
-                # Startup Process
-                redis_stats_icon = "🟢" if db_status.get('redis_stats') else "🔴"
-                embed.add_field(
-                    name="🚀 Startup Process",
-                    value=f"**Health Server:** Running\n"
-                          f"**Scheduler:** Active\n"
-                          f"**Commands:** Synced\n"
-                          f"**Redis Stats:** {redis_stats_icon}",
-                    inline=False
-                )
-                
-                await channel.send(embed=embed)
+                status = await self._gather_status()
+                await channel.send(embed=self._build_status_embed(status, 'start'))
                 self.logger.info("[bot._send_startup_notification] Startup notification sent")
             else:
                 self.logger.warning(f"[bot._send_startup_notification] Admin notification channel not found: {self.admin_notification_channel_id}")
@@ -322,53 +532,93 @@ class AgoraBot(commands.Bot):
         if message.author.bot:
             return
         
-        # Track channel activity for scoring
-        await self._track_channel_activity(message)
+        # Track channel activity for scoring (buffer-only, never blocks dispatch)
+        self._track_channel_activity(message)
         
-        # Process commands (for legacy prefix commands if any)
-        await self.process_commands(message)
+        # Process commands (for legacy prefix commands if any); skip the
+        # command lookup entirely for ordinary chat messages
+        if message.content.startswith(self.command_prefix):
+            await self.process_commands(message)
     
-    async def _track_channel_activity(self, message):
+    def _track_channel_activity(self, message):
         """Track message activity for channel scoring."""
         try:
-            # Only track messages in text channels
-            if not isinstance(message.channel, discord.TextChannel):
+            # Check if channel is in a tracked category (DM channels have no category)
+            ch = message.channel
+            cid = getattr(ch, 'category_id', None)
+            if cid is None or cid not in self._tracked_category_ids:
                 return
             
-            # Check if channel is in a tracked category
-            if not message.channel.category_id:
-                return
-            
-            tracked_categories = [
-                self.proposed_channel_category_id,
-                self.permanent_channel_category_id
-            ]
-            
-            if message.channel.category_id not in tracked_categories:
+            # Only track messages in text channels
+            if not isinstance(ch, discord.TextChannel):
                 return
             
-            # Update Redis stats
-            if hasattr(self.db_manager, 'redis_stats'):
-                timestamp = int(message.created_at.timestamp())
-                await self.db_manager.redis_stats.increment_channel_messages(
-                    message.channel.id,
-                    message.id, 
-                    timestamp
-                )
+            # Buffer the increment; the flusher applies it to Redis in a batch
+            if self._redis_stats is not None:
+                chan_id = ch.id
+                buffer = self._msg_buffer
+                buffer.append((chan_id, message.id, int(message.created_at.timestamp())))
+                if len(buffer) >= self.MESSAGE_FLUSH_BATCH_SIZE:
+                    self._buffer_full.set()
                 
-                self.logger.info(f"[bot._track_channel_activity] Tracked message in channel {message.channel.name} (ID: {message.channel.id})")
+                logger = self.logger
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[bot._track_channel_activity] Tracked message in channel %s (ID: %s)", ch.name, chan_id)
             else:
                 self.logger.warning("[bot._track_channel_activity] redis_stats not available for message tracking")
         except Exception as e:
-            self.logger.error(f"[bot._track_channel_activity] Error tracking activity: {e}", exc_info=True)
+            self.logger.error("[bot._track_channel_activity] Error tracking activity: %s", e, exc_info=True)
+    
+    async def _message_flush_loop(self):
+        """Periodically flush buffered message activity to Redis."""
+        while True:
+            try:
+                await asyncio.wait_for(self._buffer_full.wait(), timeout=self.MESSAGE_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush_message_buffer()
+    
+    async def flush_message_buffer(self):
+        """Swap out the message buffer and write it to Redis in one pipeline."""
+        items, self._msg_buffer = self._msg_buffer, []
+        self._buffer_full.clear()
+        
+        if not items:
+            return
+        
+        if self._redis_stats is not None:
+            await self._redis_stats.increment_channel_messages_batch(items)
+        else:
+            self.logger.warning(f"[bot.flush_message_buffer] redis_stats not available, dropped {len(items)} buffered messages")
+    
+    async def _stop_message_flusher(self):
+        """Stop the background flusher and write out anything still buffered."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        try:
+            await self.flush_message_buffer()
+        except Exception as e:
+            self.logger.error(f"[bot._stop_message_flusher] Failed to flush message buffer: {e}", exc_info=True)
+    
+    async def _close_http_session(self):
+        """Close the shared HTTP session if it is open."""
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+        self.http_session = None
     
     async def on_error(self, event, *args, **kwargs):
         """Global error handler for Discord events."""
-        self.logger.error(f"[bot.on_error] Error in event {event}", exc_info=True)
+        self.logger.error("[bot.on_error] Error in event %s", event, exc_info=True)
     
     async def on_command_error(self, ctx, error):
         """Global error handler for commands."""
-        self.logger.error(f"[bot.on_command_error] Command error: {error}", exc_info=True)
+        self.logger.error("[bot.on_command_error] Command error: %s", error, exc_info=True)
     
     async def on_app_command_error(self, interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
         """Global error handler for application (slash) commands."""
@@ -377,7 +627,7 @@ class AgoraBot(commands.Bot):
         
         # Handle specific error types
         if isinstance(error, discord.app_commands.CheckFailure):
-            self.logger.warning(f"[bot.on_app_command_error] Permission denied for /{command_name} by user {user_id}")
+            self.logger.warning("[bot.on_app_command_error] Permission denied for /%s by user %s", command_name, user_id)
             
             # Send user-friendly permission error message
             embed = discord.Embed(
@@ -394,15 +644,7 @@ class AgoraBot(commands.Bot):
                     inline=True
                 )
             else:
-                role_mentions = []
-                guild = interaction.guild
-                if guild:
-                    for role_id in self.admin_role_ids:
-                        role = guild.get_role(role_id)
-                        if role:
-                            role_mentions.append(role.mention)
-                        else:
-                            role_mentions.append(f"<@&{role_id}>")  # Fallback mention
+                role_mentions = self._admin_role_mentions_template if interaction.guild else None
                 
                 if role_mentions:
                     embed.add_field(
@@ -417,7 +659,7 @@ class AgoraBot(commands.Bot):
                         inline=True
                     )
             
-            embed.set_footer(text="Contact a server administrator if you believe this is an error.")
+            embed.set_footer(text=_PERM_DENIED_FOOTER)
             
             try:
                 if interaction.response.is_done():
@@ -426,13 +668,13 @@ class AgoraBot(commands.Bot):
                     await interaction.response.send_message(embed=embed, ephemeral=True)
             except discord.errors.NotFound:
                 # Interaction expired, log but don't crash
-                self.logger.warning(f"[bot.on_app_command_error] Could not respond to expired interaction for /{command_name}")
+                self.logger.warning("[bot.on_app_command_error] Could not respond to expired interaction for /%s", command_name)
             except Exception as e:
-                self.logger.error(f"[bot.on_app_command_error] Failed to send permission error message: {e}", exc_info=True)
+                self.logger.error("[bot.on_app_command_error] Failed to send permission error message: %s", e, exc_info=True)
         
         elif isinstance(error, discord.app_commands.CommandOnCooldown):
             # Handle cooldown errors
-            self.logger.info(f"[bot.on_app_command_error] Cooldown hit for /{command_name} by user {user_id}")
+            self.logger.info("[bot.on_app_command_error] Cooldown hit for /%s by user %s", command_name, user_id)
             
             embed = discord.Embed(
                 title="⏰ Command on Cooldown",
@@ -446,20 +688,20 @@ class AgoraBot(commands.Bot):
                 else:
                     await interaction.response.send_message(embed=embed, ephemeral=True)
             except discord.errors.NotFound:
-                self.logger.warning(f"[bot.on_app_command_error] Could not respond to expired interaction for /{command_name}")
+                self.logger.warning("[bot.on_app_command_error] Could not respond to expired interaction for /%s", command_name)
             except Exception as e:
-                self.logger.error(f"[bot.on_app_command_error] Failed to send cooldown error message: {e}", exc_info=True)
+                self.logger.error("[bot.on_app_command_error] Failed to send cooldown error message: %s", e, exc_info=True)
         
         else:
             # Handle all other app command errors
-            self.logger.error(f"[bot.on_app_command_error] Unhandled error in /{command_name} by user {user_id}: {error}", exc_info=True)
+            self.logger.error("[bot.on_app_command_error] Unhandled error in /%s by user %s: %s", command_name, user_id, error, exc_info=True)
             
             embed = discord.Embed(
                 title="❌ Command Error",
-                description="An unexpected error occurred while processing your command. Please try again later.",
+                description=_COMMAND_ERROR_DESCRIPTION,
                 color=0xff0000
             )
-            embed.set_footer(text="If this problem persists, please contact a server administrator.")
+            embed.set_footer(text=_COMMAND_ERROR_FOOTER)
             
             try:
                 if interaction.response.is_done():
@@ -467,9 +709,9 @@ class AgoraBot(commands.Bot):
                 else:
                     await interaction.response.send_message(embed=embed, ephemeral=True)
             except discord.errors.NotFound:
-                self.logger.warning(f"[bot.on_app_command_error] Could not respond to expired interaction for /{command_name}")
+                self.logger.warning("[bot.on_app_command_error] Could not respond to expired interaction for /%s", command_name)
             except Exception as e:
-                self.logger.error(f"[bot.on_app_command_error] Failed to send generic error message: {e}", exc_info=True)
+                self.logger.error("[bot.on_app_command_error] Failed to send generic error message: %s", e, exc_info=True)
     
     async def close(self):
         """Override close to ensure proper cleanup."""
@@ -482,8 +724,14 @@ class AgoraBot(commands.Bot):
                 # Send shutdown notification
                 await self._send_shutdown_notification()
                 
+                # Flush buffered message activity before Redis goes away
+                await self._stop_message_flusher()
+                
+                await self._close_http_session()
+                
                 # Close database connections
                 if self.db_manager:
+                    self._redis_stats = None
                     await self.db_manager.close()
                     self.logger.info("[bot.close] Database connections closed")
                 
@@ -504,8 +752,14 @@ class AgoraBot(commands.Bot):
             # Send shutdown notification
             await self._send_shutdown_notification()
             
+            # Flush buffered message activity before Redis goes away
+            await self._stop_message_flusher()
+            
+            await self._close_http_session()
+            
             # Close database connections
             if self.db_manager:
+                self._redis_stats = None
                 await self.db_manager.close()
                 self.logger.info("[bot.shutdown] Database connections closed")
             
@@ -528,7 +782,7 @@ class AgoraBot(commands.Bot):
             category = self.get_channel(self.proposed_channel_category_id)
             if category and isinstance(category, discord.CategoryChannel):
                 # Count only text and voice channels, not other category types
-                channel_count = len([c for c in category.channels if isinstance(c, (discord.TextChannel, discord.VoiceChannel))])
+                channel_count = len(category.text_channels) + len(category.voice_channels)
                 self.logger.debug(f"[bot.get_proposed_channels_count] Found {channel_count} channels in proposed category")
                 return channel_count
             else:
@@ -546,82 +800,8 @@ class AgoraBot(commands.Bot):
             
             channel = self.get_channel(self.admin_notification_channel_id)
             if channel:
-                # Get system information
-                import psutil
-                import discord as discord_lib
-                
-                # Calculate uptime
-                if hasattr(self, 'start_time'):
-                    uptime = discord.utils.utcnow() - self.start_time
-                    uptime_str = f"{uptime.total_seconds()//60:.0f}m {uptime.total_seconds()%60:.0f}s"
-                else:
-                    uptime_str = "Unknown"
-                
-                # Calculate member count across all guilds
-                total_members = sum(guild.member_count for guild in self.guilds)
-                
-                # Get database status
-                db_status = {'postgresql': False, 'redis': False}
-                if self.db_manager:
-                    try:
-                        db_status = await self.db_manager.test_connections()
-                    except:
-                        pass  # If database is already closing
-                
-                # Memory usage
-                try:
-                    process = psutil.Process()
-                    memory_mb = process.memory_info().rss / 1024 / 1024
-                    cpu_percent = psutil.cpu_percent()
-                except:
-                    memory_mb = 0
-                    cpu_percent = 0
-                
-                embed = discord.Embed(
-                    title="🔴 Bot Shutdown",
-                    description="The Agora bot is shutting down gracefully... (Signal received)",
-                    color=0xff0000,
-                    timestamp=discord.utils.utcnow()
-                )
-                
-                # Session Stats
-                embed.add_field(
-                    name="📊 Session Stats",
-                    value=f"**Uptime:** {uptime_str}\n"
-                          f"**Guilds:** {len(self.guilds)}\n"
-                          f"**Users:** {total_members:,}",
-                    inline=True
-                )
-                
-                # Database
-                pg_icon = "🟢" if db_status.get('postgresql') else "🔴"
-                embed.add_field(
-                    name="🗄️ Database",
-                    value=f"**Status:** {pg_icon} Connected\n"
-                          f"**Events:** 3\n"  # Placeholder
-                          f"**Announcements:** 7",  # Placeholder
-                    inline=True
-                )
-                
-                # System
-                embed.add_field(
-                    name="⚙️ System",
-                    value=f"**Discord.py:** {discord_lib.__version__}\n"
-                          f"**CPU:** {cpu_percent:.1f}%\n"
-                          f"**Memory:** {memory_mb:.1f} MB",
-                    inline=True
-                )
-                
-                # Shutdown Process
-                embed.add_field(
-                    name="🔄 Shutdown Process",
-                    value=f"**Type:** Signal-triggered\n"
-                          f"**Resources:** Cleaning up\n"
-                          f"**Health:** Port closing",
-                    inline=False
-                )
-                
-                await channel.send(embed=embed)
+                status = await self._gather_status()
+                await channel.send(embed=self._build_status_embed(status, 'shutdown'))
                 self.logger.info("[bot._send_shutdown_notification] Shutdown notification sent")
             else:
                 self.logger.warning(f"[bot._send_shutdown_notification] Admin notification channel not found: {self.admin_notification_channel_id}")
@@ -632,15 +812,9 @@ class AgoraBot(commands.Bot):
         """Start the bot with token from secrets."""
         try:
             # Read Discord token from secrets
-            token_path = Path('/run/secrets/discord_bot_token.txt')
-            if not token_path.exists():
-                # Fallback to local development
-                token_path = Path('secrets/discord_bot_token.txt')
-            
-            if not token_path.exists():
+            token = _load_secret('discord_bot_token')
+            if token is None:
                 raise FileNotFoundError("Discord bot token not found in secrets")
-            
-            token = token_path.read_text().strip()
             if not token:
                 raise ValueError("Discord bot token is empty")
             
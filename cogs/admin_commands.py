@@ -4,9 +4,11 @@ Admin Commands Cog - Organized admin command groups
 This cog organizes admin commands into logical groups for better UX.
 """
 
+import asyncio
+import inspect
 import logging
-import os
-from datetime import datetime, timedelta
+import time
+import weakref
 from typing import Optional
 
 import discord
@@ -15,271 +17,433 @@ from discord.ext import commands
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED = inspect.Parameter.empty
+
+# Human-readable names of the delegate cogs, used in "not available" replies
+_DELEGATE_LABELS = {
+    'AdminManagementCog': 'Admin management',
+    'AdminEmojiManagementCog': 'Admin emoji management',
+    'AdminReportsCog': 'Admin reports',
+    'DebugCommandsCog': 'Debug commands',
+    'CoreCog': 'Core',
+}
+
+# Prebuilt send_message payloads for when a delegate cog is not loaded
+_ERR = {
+    name: {'content': f"❌ {label} cog not available", 'ephemeral': True}
+    for name, label in _DELEGATE_LABELS.items()
+}
+
+# Grouped commands that forward to an existing cog's command:
+# (group, name, description, target cog, target command, ((param, annotation, default), ...))
+_DELEGATES = (
+    # Management Group
+    ('manage', 'promote_channel', "Promote a channel from proposed to permanent",
+     'AdminManagementCog', 'promote_channel', (('channel', discord.TextChannel, _REQUIRED),)),
+    ('manage', 'recalculate_stats', "Recalculate activity statistics",
+     'AdminManagementCog', 'recalculate_stats', ()),
+    ('manage', 'refresh_channels', "Refresh channel tracking",
+     'AdminManagementCog', 'refresh_channels', ()),
+    # Proposals Group
+    ('proposals', 'review', "Review a user proposal",
+     'AdminEmojiManagementCog', 'review_proposal', (
+         ('proposal_id', int, _REQUIRED),
+         ('action', str, _REQUIRED),
+         ('final_name', Optional[str], None),
+         ('response', Optional[str], None),
+     )),
+    ('proposals', 'list', "List pending proposals",
+     'AdminEmojiManagementCog', 'list_proposals', (
+         ('status', Optional[str], None),
+         ('proposal_type', Optional[str], None),
+         ('limit', int, 10),
+     )),
+    ('proposals', 'get', "Get detailed info about a proposal",
+     'AdminEmojiManagementCog', 'get_proposal', (('proposal_id', int, _REQUIRED),)),
+    # Reports Group
+    ('reports', 'review', "Review a user report",
+     'AdminReportsCog', 'review_report', (
+         ('report_id', int, _REQUIRED),
+         ('action', str, _REQUIRED),
+         ('response', Optional[str], None),
+     )),
+    ('reports', 'list', "List pending reports",
+     'AdminReportsCog', 'list_reports', (
+         ('status', Optional[str], None),
+         ('report_type', Optional[str], None),
+         ('limit', int, 10),
+     )),
+    ('reports', 'get', "Get detailed info about a report",
+     'AdminReportsCog', 'get_report', (('report_id', int, _REQUIRED),)),
+    # Debug Group
+    ('debug', 'activity', "Debug activity scoring system",
+     'DebugCommandsCog', 'debug_activity', ()),
+    ('debug', 'channel', "Debug specific channel activity",
+     'DebugCommandsCog', 'debug_channel', (('channel', discord.TextChannel, _REQUIRED),)),
+    ('debug', 'test_tracking', "Add test message data",
+     'DebugCommandsCog', 'test_message_tracking', (
+         ('channel', discord.TextChannel, _REQUIRED),
+         ('message_count', int, 5),
+     )),
+    ('debug', 'backfill', "Backfill message statistics",
+     'DebugCommandsCog', 'backfill_stats', (
+         ('channel', Optional[discord.TextChannel], None),
+         ('days', int, 7),
+     )),
+    ('debug', 'inspect_redis', "Inspect Redis data",
+     'DebugCommandsCog', 'inspect_redis', (('channel', discord.TextChannel, _REQUIRED),)),
+    ('debug', 'trigger_reports', "Trigger activity report update",
+     'DebugCommandsCog', 'trigger_activity_report', ()),
+    ('debug', 'sync', "Sync slash commands",
+     'DebugCommandsCog', 'sync_commands', ()),
+    # System Group
+    ('system', 'status', "Check bot and database health",
+     'CoreCog', 'status', ()),
+    ('system', 'info', "Get bot information",
+     'CoreCog', 'info', ()),
+)
+
+# Fixed option values for grouped commands, validated by Discord before they reach the bot
+_PROPOSAL_ACTIONS = [
+    app_commands.Choice(name='Approved', value='approved'),
+    app_commands.Choice(name='Rejected', value='rejected'),
+    app_commands.Choice(name='Needs Changes', value='needs_changes'),
+]
+_PROPOSAL_STATUSES = [
+    app_commands.Choice(name='Pending', value='pending'),
+    *_PROPOSAL_ACTIONS,
+]
+_PROPOSAL_TYPES = [
+    app_commands.Choice(name='Emoji', value='emoji'),
+    app_commands.Choice(name='Channel', value='channel'),
+]
+_REPORT_ACTIONS = [
+    app_commands.Choice(name='Resolved', value='resolved'),
+    app_commands.Choice(name='Dismissed', value='dismissed'),
+    app_commands.Choice(name='Escalated', value='escalated'),
+    app_commands.Choice(name='Investigating', value='investigating'),
+]
+_REPORT_STATUSES = [
+    app_commands.Choice(name='Pending', value='pending'),
+    *_REPORT_ACTIONS,
+]
+_REPORT_TYPES = [
+    app_commands.Choice(name='User Behavior', value='user_behavior'),
+    app_commands.Choice(name='Spam', value='spam'),
+    app_commands.Choice(name='Harassment', value='harassment'),
+    app_commands.Choice(name='Inappropriate Content', value='inappropriate_content'),
+    app_commands.Choice(name='Technical Issue', value='technical_issue'),
+    app_commands.Choice(name='Other', value='other'),
+]
+
+# (group, name) -> {param: choices}
+_CHOICES = {
+    ('proposals', 'review'): {'action': _PROPOSAL_ACTIONS},
+    ('proposals', 'list'): {'status': _PROPOSAL_STATUSES, 'proposal_type': _PROPOSAL_TYPES},
+    ('reports', 'review'): {'action': _REPORT_ACTIONS},
+    ('reports', 'list'): {'status': _REPORT_STATUSES, 'report_type': _REPORT_TYPES},
+}
+
+# Long-running delegates; they are acknowledged up front and run in the background
+_BACKGROUND_COMMANDS = frozenset({
+    'recalculate_stats',
+    'refresh_channels',
+    'backfill_stats',
+    'trigger_activity_report',
+    'sync_commands',
+})
+
+# Idempotent background delegates; identical calls made while one is running wait for it instead
+_COALESCED_COMMANDS = frozenset({
+    'recalculate_stats',
+    'refresh_channels',
+    'trigger_activity_report',
+    'sync_commands',
+})
+
+# Listings whose replies are replayed for the same admin's repeat calls within the cache
+# TTL. Cogs that write proposals or reports dispatch proposals_changed/reports_changed,
+# which drops the affected entries; single-item lookups and system status always run.
+_CACHED_COMMANDS = frozenset({
+    'list_proposals',
+    'list_reports',
+})
+
+# Only replies built from these send_message/followup.send arguments are replayed
+_REPLAYABLE_KWARGS = frozenset({'content', 'embed', 'embeds', 'ephemeral'})
+
+
+class _RecordingResponse:
+    """InteractionResponse proxy that records sent messages."""
+    
+    __slots__ = ('_response', '_sent')
+    
+    def __init__(self, response: discord.InteractionResponse, sent: list):
+        self._response = response
+        self._sent = sent
+    
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+    
+    async def send_message(self, content=None, **kwargs):
+        self._sent.append(dict(kwargs, content=content))
+        return await self._response.send_message(content, **kwargs)
+
+
+class _RecordingFollowup:
+    """Followup webhook proxy that records sent messages."""
+    
+    __slots__ = ('_followup', '_sent')
+    
+    def __init__(self, followup: discord.Webhook, sent: list):
+        self._followup = followup
+        self._sent = sent
+    
+    def __getattr__(self, name):
+        return getattr(self._followup, name)
+    
+    async def send(self, content=None, **kwargs):
+        self._sent.append(dict(kwargs, content=content))
+        return await self._followup.send(content, **kwargs)
+
+
+class _RecordingInteraction:
+    """Interaction proxy that records every message a delegate sends, so it can be replayed."""
+    
+    __slots__ = ('_interaction', 'sent', 'response', 'followup')
+    
+    def __init__(self, interaction: discord.Interaction):
+        self._interaction = interaction
+        self.sent: list[dict] = []
+        self.response = _RecordingResponse(interaction.response, self.sent)
+        self.followup = _RecordingFollowup(interaction.followup, self.sent)
+    
+    def __getattr__(self, name):
+        return getattr(self._interaction, name)
+
+
+def _make_delegate(name: str, description: str, target: str, method: str, params: tuple):
+    """Build a command callback that forwards to the ``method`` command of the ``target`` cog."""
+    error = _ERR[target]
+    background = method in _BACKGROUND_COMMANDS
+    cached = method in _CACHED_COMMANDS
+    coalesced = method in _COALESCED_COMMANDS
+
+    async def _delegate(self, interaction: discord.Interaction, **kwargs):
+        cog = self._get_delegate(target)
+        if not cog:
+            await interaction.response.send_message(**error)
+            return
+        
+        # Delegate attributes are app_commands.Command objects; invoke their callback
+        callback = getattr(cog, method).callback
+        if cached:
+            await self._run_cached(interaction, (target, method, interaction.user.id, *kwargs.items()), callback, cog, kwargs)
+            return
+        
+        if background:
+            key = (target, method, *kwargs.items()) if coalesced else None
+            await self._dispatch(interaction, name, lambda: callback(cog, interaction, **kwargs), key)
+        else:
+            await callback(cog, interaction, **kwargs)
+
+    # discord.py builds command options from the signature, and binds the cog as
+    # ``self`` only when the qualified name marks the callback as a method
+    _delegate.__signature__ = inspect.Signature([
+        inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD),
+        inspect.Parameter('interaction', inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=discord.Interaction),
+        *(
+            inspect.Parameter(param, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation, default=default)
+            for param, annotation, default in params
+        ),
+    ])
+    _delegate.__name__ = name
+    _delegate.__qualname__ = f"AdminCommandsCog.{name}"
+    _delegate.__doc__ = description
+    return _delegate
+
 
 class AdminCommandsCog(commands.Cog):
     """Cog for organized admin command groups."""
     
+    # Seconds a read-only delegate reply is replayed for identical calls
+    RESULT_CACHE_TTL = 15.0
+    # Maximum number of replayable replies kept at once
+    RESULT_CACHE_SIZE = 256
+    # Maximum number of background delegate commands running at once
+    MAX_BACKGROUND_COMMANDS = 4
+    
     def __init__(self, bot):
         """Initialize the admin commands cog."""
         self.bot = bot
-        self.logger = logging.getLogger('admin_commands')
+        self._delegates: dict[str, weakref.ref] = {}
+        self._result_cache: dict[tuple, tuple[float, list[dict]]] = {}
+        self._runner_sem: Optional[asyncio.Semaphore] = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._inflight: dict[tuple, asyncio.Task] = {}
+    
+    async def cog_load(self):
+        """Bind weak references to whichever delegate cogs are already loaded."""
+        self._runner_sem = asyncio.Semaphore(self.MAX_BACKGROUND_COMMANDS)
+        self._delegates.clear()
+        for name in _DELEGATE_LABELS:
+            self._bind_delegate(name)
+    
+    async def cog_unload(self):
+        """Cancel background delegate commands that are still running."""
+        for task in self._background_tasks:
+            task.cancel()
+        self._background_tasks.clear()
+        self._inflight.clear()
+    
+    def _bind_delegate(self, name: str) -> Optional[commands.Cog]:
+        """Look up a delegate cog and keep a weak reference to it if loaded."""
+        cog = self.bot.get_cog(name)
+        if cog is not None:
+            self._delegates[name] = weakref.ref(cog)
+        return cog
+    
+    def _get_delegate(self, name: str) -> Optional[commands.Cog]:
+        """Return the named delegate cog, rebinding if it was unloaded or reloaded."""
+        ref = self._delegates.get(name)
+        cog = ref() if ref is not None else None
+        if cog is None:
+            cog = self._bind_delegate(name)
+        return cog
+    
+    async def _run_cached(self, interaction: discord.Interaction, key: tuple, callback, cog, kwargs: dict):
+        """Replay a recent reply for ``key`` or run the delegate and remember what it sent."""
+        now = time.monotonic()
+        hit = self._result_cache.get(key)
+        if hit is not None and hit[0] > now:
+            first, *rest = hit[1]
+            await interaction.response.send_message(**first)
+            send = interaction.followup.send
+            for message in rest:
+                await send(**message)
+            return
+        
+        recorder = _RecordingInteraction(interaction)
+        await callback(cog, recorder, **kwargs)
+        
+        # Skip empty replies, errors and anything carrying views, files or other state
+        sent = recorder.sent
+        if sent and all(
+            message.keys() <= _REPLAYABLE_KWARGS and not str(message['content'] or '').startswith('❌')
+            for message in sent
+        ):
+            self._cache_result(key, sent, now)
+    
+    def _cache_result(self, key: tuple, sent: list[dict], now: float):
+        """Remember a reply, dropping expired entries and evicting the oldest when full."""
+        cache = self._result_cache
+        for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+            del cache[stale]
+        cache.pop(key, None)
+        if len(cache) >= self.RESULT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = (now + self.RESULT_CACHE_TTL, sent)
+    
+    async def _dispatch(self, interaction: discord.Interaction, name: str, coro_factory, key: Optional[tuple] = None):
+        """Acknowledge the interaction now and run the delegate in a bounded background task.
+        
+        When ``key`` is given and an identical command is already running, the new
+        interaction waits for that run instead of starting another one.
+        """
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
+        
+        running = self._inflight.get(key) if key is not None else None
+        if running is not None:
+            task = asyncio.create_task(self._join(interaction, name, running))
+        else:
+            task = asyncio.create_task(self._run(interaction, name, coro_factory))
+            if key is not None:
+                self._inflight[key] = task
+                task.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _join(self, interaction: discord.Interaction, name: str, running: asyncio.Task):
+        """Wait for an identical command that is already running and report when it is done."""
+        await asyncio.wait((running,))
+        await interaction.followup.send(
+            f"ℹ️ An identical `{name}` request was already running; it has now finished.",
+            ephemeral=True
+        )
+    
+    async def _run(self, interaction: discord.Interaction, name: str, coro_factory):
+        """Run a deferred delegate command once a background slot is free."""
+        async with self._runner_sem:
+            try:
+                await coro_factory()
+            except Exception as e:
+                logger.error(f"[admin_commands._run] Background command {name} failed: {e}")
+                await interaction.followup.send(f"❌ Error running {name}: {str(e)}", ephemeral=True)
     
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Check if user has admin permissions for all commands in this cog."""
         return self.bot.has_admin_permissions(interaction.user)
 
-    # Management Group
+    # Command groups; their subcommands are generated from _DELEGATES
     management_group = app_commands.Group(
         name="manage",
         description="Channel and server management commands"
     )
-
-    @management_group.command(name="promote_channel", description="Promote a channel from proposed to permanent")
-    async def promote_channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
-        """Promote a channel from proposed to permanent category."""
-        # Delegate to existing admin_management cog
-        admin_mgmt_cog = self.bot.get_cog('AdminManagementCog')
-        if admin_mgmt_cog:
-            await admin_mgmt_cog.promote_channel(interaction, channel)
-        else:
-            await interaction.response.send_message("❌ Admin management cog not available", ephemeral=True)
-
-    @management_group.command(name="recalculate_stats", description="Recalculate activity statistics")
-    async def recalculate_stats(self, interaction: discord.Interaction):
-        """Recalculate activity statistics for tracked channels."""
-        # Delegate to existing admin_management cog
-        admin_mgmt_cog = self.bot.get_cog('AdminManagementCog')
-        if admin_mgmt_cog:
-            await admin_mgmt_cog.recalculate_stats(interaction)
-        else:
-            await interaction.response.send_message("❌ Admin management cog not available", ephemeral=True)
-
-    @management_group.command(name="refresh_channels", description="Refresh channel tracking")
-    async def refresh_channels(self, interaction: discord.Interaction):
-        """Refresh channel tracking and force update activity reports."""
-        # Delegate to existing admin_management cog
-        admin_mgmt_cog = self.bot.get_cog('AdminManagementCog')
-        if admin_mgmt_cog:
-            await admin_mgmt_cog.refresh_channels(interaction)
-        else:
-            await interaction.response.send_message("❌ Admin management cog not available", ephemeral=True)
-
-    # Proposals Group
     proposals_group = app_commands.Group(
         name="proposals",
         description="Review and manage user proposals"
     )
-
-    @proposals_group.command(name="review", description="Review a user proposal")
-    async def review_proposal(
-        self, 
-        interaction: discord.Interaction, 
-        proposal_id: int,
-        action: str,
-        final_name: Optional[str] = None,
-        response: Optional[str] = None
-    ):
-        """Review and take action on a user proposal."""
-        # Delegate to existing admin_emoji_management cog
-        admin_emoji_cog = self.bot.get_cog('AdminEmojiManagementCog')
-        if admin_emoji_cog:
-            await admin_emoji_cog.review_proposal(interaction, proposal_id, action, final_name, response)
-        else:
-            await interaction.response.send_message("❌ Admin emoji management cog not available", ephemeral=True)
-
-    @proposals_group.command(name="list", description="List pending proposals")
-    async def list_proposals(
-        self,
-        interaction: discord.Interaction,
-        status: Optional[str] = None,
-        proposal_type: Optional[str] = None,
-        user: Optional[discord.Member] = None
-    ):
-        """List proposals with filtering options."""
-        # Delegate to existing admin_emoji_management cog
-        admin_emoji_cog = self.bot.get_cog('AdminEmojiManagementCog')
-        if admin_emoji_cog:
-            await admin_emoji_cog.list_proposals(interaction, status, proposal_type, user)
-        else:
-            await interaction.response.send_message("❌ Admin emoji management cog not available", ephemeral=True)
-
-    @proposals_group.command(name="get", description="Get detailed info about a proposal")
-    async def get_proposal(self, interaction: discord.Interaction, proposal_id: int):
-        """Get detailed information about a specific proposal."""
-        # Delegate to existing admin_emoji_management cog
-        admin_emoji_cog = self.bot.get_cog('AdminEmojiManagementCog')
-        if admin_emoji_cog:
-            await admin_emoji_cog.get_proposal(interaction, proposal_id)
-        else:
-            await interaction.response.send_message("❌ Admin emoji management cog not available", ephemeral=True)
-
-    # Reports Group
     reports_group = app_commands.Group(
         name="reports",
         description="Review and manage user reports"
     )
-
-    @reports_group.command(name="review", description="Review a user report")
-    async def review_report(
-        self,
-        interaction: discord.Interaction,
-        report_id: int,
-        action: str,
-        response: Optional[str] = None
-    ):
-        """Review and take action on a user report."""
-        # Delegate to existing admin_reports cog
-        admin_reports_cog = self.bot.get_cog('AdminReportsCog')
-        if admin_reports_cog:
-            await admin_reports_cog.review_report(interaction, report_id, action, response)
-        else:
-            await interaction.response.send_message("❌ Admin reports cog not available", ephemeral=True)
-
-    @reports_group.command(name="list", description="List pending reports")
-    async def list_reports(
-        self,
-        interaction: discord.Interaction,
-        status: Optional[str] = None,
-        user: Optional[discord.Member] = None
-    ):
-        """List reports with filtering options."""
-        # Delegate to existing admin_reports cog
-        admin_reports_cog = self.bot.get_cog('AdminReportsCog')
-        if admin_reports_cog:
-            await admin_reports_cog.list_reports(interaction, status, user)
-        else:
-            await interaction.response.send_message("❌ Admin reports cog not available", ephemeral=True)
-
-    @reports_group.command(name="get", description="Get detailed info about a report")
-    async def get_report(self, interaction: discord.Interaction, report_id: int):
-        """Get detailed information about a specific report."""
-        # Delegate to existing admin_reports cog
-        admin_reports_cog = self.bot.get_cog('AdminReportsCog')
-        if admin_reports_cog:
-            await admin_reports_cog.get_report(interaction, report_id)
-        else:
-            await interaction.response.send_message("❌ Admin reports cog not available", ephemeral=True)
-
-    # Debug Group
     debug_group = app_commands.Group(
         name="debug",
         description="Debug and troubleshooting commands"
     )
-
-    @debug_group.command(name="activity", description="Debug activity scoring system")
-    async def debug_activity(self, interaction: discord.Interaction):
-        """Debug the activity scoring system."""
-        # Delegate to existing debug_commands cog
-        debug_cog = self.bot.get_cog('DebugCommandsCog')
-        if debug_cog:
-            await debug_cog.debug_activity(interaction)
-        else:
-            await interaction.response.send_message("❌ Debug commands cog not available", ephemeral=True)
-
-    @debug_group.command(name="channel", description="Debug specific channel activity")
-    async def debug_channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
-        """Debug channel activity and scoring."""
-        # Delegate to existing debug_commands cog
-        debug_cog = self.bot.get_cog('DebugCommandsCog')
-        if debug_cog:
-            await debug_cog.debug_channel(interaction, channel)
-        else:
-            await interaction.response.send_message("❌ Debug commands cog not available", ephemeral=True)
-
-    @debug_group.command(name="test_tracking", description="Add test message data")
-    async def test_message_tracking(
-        self, 
-        interaction: discord.Interaction, 
-        channel: discord.TextChannel, 
-        message_count: int = 5
-    ):
-        """Add test message data to Redis for a channel."""
-        # Delegate to existing debug_commands cog
-        debug_cog = self.bot.get_cog('DebugCommandsCog')
-        if debug_cog:
-            await debug_cog.test_message_tracking(interaction, channel, message_count)
-        else:
-            await interaction.response.send_message("❌ Debug commands cog not available", ephemeral=True)
-
-    @debug_group.command(name="backfill", description="Backfill message statistics")
-    async def backfill_stats(
-        self, 
-        interaction: discord.Interaction, 
-        channel: Optional[discord.TextChannel] = None, 
-        days: int = 7
-    ):
-        """Backfill message statistics from recent channel history."""
-        # Delegate to existing debug_commands cog
-        debug_cog = self.bot.get_cog('DebugCommandsCog')
-        if debug_cog:
-            await debug_cog.backfill_stats(interaction, channel, days)
-        else:
-            await interaction.response.send_message("❌ Debug commands cog not available", ephemeral=True)
-
-    @debug_group.command(name="inspect_redis", description="Inspect Redis data")
-    async def inspect_redis(self, interaction: discord.Interaction, channel: discord.TextChannel):
-        """Inspect Redis data for a specific channel."""
-        # Delegate to existing debug_commands cog
-        debug_cog = self.bot.get_cog('DebugCommandsCog')
-        if debug_cog:
-            await debug_cog.inspect_redis(interaction, channel)
-        else:
-            await interaction.response.send_message("❌ Debug commands cog not available", ephemeral=True)
-
-    @debug_group.command(name="trigger_reports", description="Trigger activity report update")
-    async def trigger_activity_report(self, interaction: discord.Interaction):
-        """Manually trigger activity report update."""
-        # Delegate to existing debug_commands cog
-        debug_cog = self.bot.get_cog('DebugCommandsCog')
-        if debug_cog:
-            await debug_cog.trigger_activity_report(interaction)
-        else:
-            await interaction.response.send_message("❌ Debug commands cog not available", ephemeral=True)
-
-    @debug_group.command(name="sync", description="Sync slash commands")
-    async def sync_commands(self, interaction: discord.Interaction):
-        """Manually sync slash commands."""
-        # Delegate to existing debug_commands cog
-        debug_cog = self.bot.get_cog('DebugCommandsCog')
-        if debug_cog:
-            await debug_cog.sync_commands(interaction)
-        else:
-            await interaction.response.send_message("❌ Debug commands cog not available", ephemeral=True)
-
-    # System Group
     system_group = app_commands.Group(
         name="system",
         description="System information and health commands"
     )
 
-    @system_group.command(name="status", description="Check bot and database health")
-    async def status(self, interaction: discord.Interaction):
-        """Check bot and database health status."""
-        # Delegate to existing core cog
-        core_cog = self.bot.get_cog('CoreCog')
-        if core_cog:
-            await core_cog.status(interaction)
-        else:
-            await interaction.response.send_message("❌ Core cog not available", ephemeral=True)
-
-    @system_group.command(name="info", description="Get bot information")
-    async def info(self, interaction: discord.Interaction):
-        """Display bot information and basic statistics."""
-        # Delegate to existing core cog
-        core_cog = self.bot.get_cog('CoreCog')
-        if core_cog:
-            await core_cog.info(interaction)
-        else:
-            await interaction.response.send_message("❌ Core cog not available", ephemeral=True)
-
+    _GROUPS = (management_group, proposals_group, reports_group, debug_group, system_group)
+    
+    _groups = {group.name: group for group in _GROUPS}
+    for _group, _name, _description, _target, _method, _params in _DELEGATES:
+        _callback = _make_delegate(_name, _description, _target, _method, _params)
+        if (_group, _name) in _CHOICES:
+            _callback = app_commands.choices(**_CHOICES[_group, _name])(_callback)
+        _groups[_group].command(name=_name, description=_description)(_callback)
+    del _groups, _group, _name, _description, _target, _method, _params, _callback
+    _group_names = ', '.join(group.name for group in _GROUPS)
+
+    def _drop_cached_results(self, target: str):
+        """Forget cached replies from the given delegate cog."""
+        cache = self._result_cache
+        for key in [key for key in cache if key[0] == target]:
+            del cache[key]
+    
+    @commands.Cog.listener()
+    async def on_proposals_changed(self):
+        """Drop cached proposal listings after a proposal is created or reviewed."""
+        self._drop_cached_results('AdminEmojiManagementCog')
+    
+    @commands.Cog.listener()
+    async def on_reports_changed(self):
+        """Drop cached report listings after a report is created or reviewed."""
+        self._drop_cached_results('AdminReportsCog')
+    
     @commands.Cog.listener()
     async def on_ready(self):
         """Called when the cog is ready."""
-        self.logger.info("[admin_commands.on_ready] Admin commands cog is ready")
-        self.logger.info("[admin_commands.on_ready] Available command groups: manage, proposals, reports, debug, system")
+        # Re-resolve delegates after (re)connecting in case cogs were reloaded
+        self._delegates.clear()
+        logger.info("[admin_commands.on_ready] Admin commands cog is ready")
+        logger.info(f"[admin_commands.on_ready] Available command groups: {self._group_names}")
 
 
 async def setup(bot):
     """Add cog to bot."""
     await bot.add_cog(AdminCommandsCog(bot))
-    logging.getLogger('cogs.admin_commands').info("[admin_commands.setup] Admin commands cog loaded successfully")
\ No newline at end of file
+    logger.info("[admin_commands.setup] Admin commands cog loaded successfully")
@@ -6,6 +6,8 @@ emoji proposals including LLM-assisted suggestions.
 """
 
 import logging
+import re
+import weakref
 from datetime import datetime
 from typing import Optional
 
@@ -13,8 +15,94 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from cogs.choices import build_choices, filter_choices
 from database.db_models import Proposal
 
+# Discord custom emoji names: 2-32 ASCII letters, digits or underscores
+_EMOJI_NAME_RE = re.compile(r'\A[A-Za-z0-9_]{2,32}\Z')
+
+class _NameCharFilter(dict):
+    """str.translate table that keeps [a-z0-9_-] and deletes every other character."""
+    
+    __slots__ = ()
+    
+    def __missing__(self, codepoint: int) -> None:
+        # Delete without storing, so arbitrary user input can't grow the table
+        return None
+
+
+_NAME_TRANSLATION = _NameCharFilter({ord(c): ord(c) for c in 'abcdefghijklmnopqrstuvwxyz0123456789-_'})
+
+# Channel name cleanup and validation patterns
+_RE_COLLAPSE_SEP = re.compile(r'[-_]+')
+# [a-z0-9_-] only, and no leading or trailing hyphen
+_RE_DISCORD_NAME = re.compile(r'[a-z0-9_](?:[a-z0-9\-_]*[a-z0-9_])?')
+
+# Discord rejects custom emoji images larger than 256 KiB
+_MAX_EMOJI_BYTES = 256 * 1024
+
+# Review actions an admin may take, and the statuses a proposal can still be reviewed in
+_REVIEW_ACTIONS = ('approved', 'rejected', 'needs_changes')
+_REVIEWABLE_STATUSES = frozenset({'pending', 'needs_changes'})
+
+# Display lookups shared by the list and detail views
+_STATUS_EMOJI = {
+    'pending': '🟡',
+    'approved': '✅',
+    'rejected': '❌',
+    'needs_changes': '🔄'
+}
+_STATUS_COLORS = {
+    'pending': 0xffa500,
+    'approved': 0x00ff00,
+    'rejected': 0xff0000,
+    'needs_changes': 0xff9900
+}
+_TYPE_EMOJI = {
+    'emoji': '🎨',
+    'channel': '💬'
+}
+
+# Opening line of the proposer's DM for each review action
+_ACTION_MESSAGES = {
+    'approved': "Your proposal has been **approved**! 🎉",
+    'rejected': "Your proposal has been **rejected**",
+    'needs_changes': "Your proposal **needs changes** before it can be approved"
+}
+
+# Footer of the proposer's DM keyed by (action, proposal_type); a None type is the action's fallback
+_FOOTER_TEXT = {
+    ('approved', 'emoji'): "Your emoji has been added to the server! Thank you for contributing.",
+    ('approved', 'channel'): "Your channel has been created! Thank you for contributing to the community.",
+    ('approved', None): "Thank you for your contribution to the server!",
+    ('needs_changes', None): "You can submit a new proposal with the requested changes.",
+}
+_DEFAULT_FOOTER_TEXT = "Thank you for your interest in contributing to the server."
+
+
+# Static autocomplete options; handlers only filter these by the typed text
+_ACTION_CHOICES = build_choices(('Approved', 'approved'), ('Rejected', 'rejected'), ('Needs Changes', 'needs_changes'))
+_TYPE_CHOICES = build_choices(('Emoji', 'emoji'), ('Channel', 'channel'))
+_STATUS_CHOICES = build_choices(
+    ('Pending', 'pending'),
+    ('Approved', 'approved'),
+    ('Rejected', 'rejected'),
+    ('Needs Changes', 'needs_changes')
+)
+
+
+def _add_fields(embed: discord.Embed, *fields: tuple[str, str, bool]) -> discord.Embed:
+    """Add (name, value, inline) fields to an embed in order."""
+    add_field = embed.add_field
+    for name, value, inline in fields:
+        add_field(name=name, value=value, inline=inline)
+    return embed
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Shorten text to ``limit`` characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 class AdminEmojiManagementCog(commands.Cog):
     """Cog for admin emoji proposal management functionality."""
@@ -22,6 +110,11 @@ class AdminEmojiManagementCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger('cogs.admin_emoji_management')
+        self._proposed_category: Optional[discord.CategoryChannel] = None
+        # Bot configuration is fixed once loaded, so bind the ID directly
+        self._announcement_channel_id: Optional[int] = bot.public_announcement_channel_id
+        self._announcement_channel_cache: Optional[discord.TextChannel] = None
+        self._user_proposals_cog: Optional[weakref.ref] = None
     
     def cog_check(self, ctx):
         """Check if user has admin permissions."""
@@ -50,24 +143,19 @@ class AdminEmojiManagementCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            self.logger.info(f"[admin_emoji_management.review_proposal] Proposal {proposal_id} being reviewed by {interaction.user.id}")
+            self.logger.info("[admin_emoji_management.review_proposal] Proposal %s being reviewed by %s", proposal_id, interaction.user.id)
             
             # Validate action
-            valid_actions = ['approved', 'rejected', 'needs_changes']
-            if action not in valid_actions:
+            if action not in _REVIEW_ACTIONS:
                 await interaction.followup.send(
-                    f"❌ **Error**: Invalid action. Valid actions: {', '.join(valid_actions)}",
+                    f"❌ **Error**: Invalid action. Valid actions: {', '.join(_REVIEW_ACTIONS)}",
                     ephemeral=True
                 )
                 return
             
             # Get proposal from database
             async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select
-                result = await session.execute(
-                    select(Proposal).where(Proposal.proposal_id == proposal_id)
-                )
-                proposal = result.scalar_one_or_none()
+                proposal = await session.get(Proposal, proposal_id)
                 
                 if not proposal:
                     await interaction.followup.send(
@@ -77,7 +165,7 @@ class AdminEmojiManagementCog(commands.Cog):
                     return
                 
                 # Only allow updates to pending proposals or those needing changes
-                if proposal.status not in ['pending', 'needs_changes']:
+                if proposal.status not in _REVIEWABLE_STATUSES:
                     await interaction.followup.send(
                         f"❌ **Error**: Proposal `{proposal_id}` has already been {proposal.status}.",
                         ephemeral=True
@@ -108,19 +196,15 @@ class AdminEmojiManagementCog(commands.Cog):
                 
                 await session.commit()
             
+            self.bot.dispatch('proposals_changed')
+            
             # If approved, create the emoji or channel
             if action == 'approved':
                 if proposal.proposal_type == 'emoji':
                     emoji_created = await self._create_emoji(proposal, interaction.guild)
                     if not emoji_created:
                         # Revert status if emoji creation failed
-                        async with self.bot.db_manager.get_pg_session() as session:
-                            result = await session.execute(
-                                select(Proposal).where(Proposal.proposal_id == proposal_id)
-                            )
-                            proposal_update = result.scalar_one()
-                            proposal_update.status = 'needs_changes'
-                            await session.commit()
+                        await self._mark_needs_changes(proposal_id)
                         
                         await interaction.followup.send(
                             f"❌ **Error**: Failed to create emoji. Proposal marked as needs changes.",
@@ -134,13 +218,7 @@ class AdminEmojiManagementCog(commands.Cog):
                     channel_created = await self._create_channel(proposal, interaction.guild)
                     if not channel_created:
                         # Revert status if channel creation failed
-                        async with self.bot.db_manager.get_pg_session() as session:
-                            result = await session.execute(
-                                select(Proposal).where(Proposal.proposal_id == proposal_id)
-                            )
-                            proposal_update = result.scalar_one()
-                            proposal_update.status = 'needs_changes'
-                            await session.commit()
+                        await self._mark_needs_changes(proposal_id)
                         
                         await interaction.followup.send(
                             f"❌ **Error**: Failed to create channel. Proposal marked as needs changes.",
@@ -168,7 +246,7 @@ class AdminEmojiManagementCog(commands.Cog):
             elif proposal.proposal_type == 'channel':
                 channel_name = final_name or proposal.llm_suggestion or proposal.original_text
                 embed.add_field(name="Channel Name", value=f"#{channel_name}", inline=True)
-                embed.add_field(name="Description", value=proposal.original_text[:200] + "..." if len(proposal.original_text) > 200 else proposal.original_text, inline=False)
+                embed.add_field(name="Description", value=_trunc(proposal.original_text, 200), inline=False)
             
             if final_name:
                 if proposal.proposal_type == 'emoji':
@@ -177,7 +255,7 @@ class AdminEmojiManagementCog(commands.Cog):
                     embed.add_field(name="Final Name", value=f"#{final_name}", inline=True)
             
             if response:
-                embed.add_field(name="Response Sent", value=response[:100] + "..." if len(response) > 100 else response, inline=False)
+                embed.add_field(name="Response Sent", value=_trunc(response, 100), inline=False)
             
             # Add status information
             if action == 'needs_changes':
@@ -203,10 +281,10 @@ class AdminEmojiManagementCog(commands.Cog):
             # Send admin log
             await self._send_admin_log(proposal, action, final_name, response, interaction.user)
             
-            self.logger.info(f"[admin_emoji_management.review_proposal] Proposal {proposal_id} marked as {action} by {interaction.user.id}")
+            self.logger.info("[admin_emoji_management.review_proposal] Proposal %s marked as %s by %s", proposal_id, action, interaction.user.id)
             
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management.review_proposal] Error reviewing proposal {proposal_id}: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management.review_proposal] Error reviewing proposal %s: %s", proposal_id, e, exc_info=True)
             await interaction.followup.send(
                 "❌ **Error**: Failed to review proposal. Please try again later.",
                 ephemeral=True
@@ -219,17 +297,7 @@ class AdminEmojiManagementCog(commands.Cog):
         current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for proposal actions."""
-        actions = [
-            ('Approved', 'approved'),
-            ('Rejected', 'rejected'),
-            ('Needs Changes', 'needs_changes')
-        ]
-        
-        return [
-            app_commands.Choice(name=name, value=value)
-            for name, value in actions
-            if current.lower() in name.lower()
-        ][:25]
+        return filter_choices(_ACTION_CHOICES, current)
     
     @app_commands.command(name="list_proposals", description="List proposals with filtering options")
     @app_commands.describe(
@@ -253,19 +321,38 @@ class AdminEmojiManagementCog(commands.Cog):
             elif limit < 1:
                 limit = 1
             
-            # Build query
+            # Build filters shared by the page query and the summary counts
+            filters = []
+            if proposal_type:
+                filters.append(Proposal.proposal_type == proposal_type)
+            if status:
+                filters.append(Proposal.status == status)
+            
             async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select, desc
-                query = select(Proposal).order_by(desc(Proposal.created_at)).limit(limit)
-                
-                if proposal_type:
-                    query = query.where(Proposal.proposal_type == proposal_type)
-                
-                if status:
-                    query = query.where(Proposal.status == status)
-                
+                from sqlalchemy import select, desc, func
+                from sqlalchemy.orm import load_only
+                # Only the columns the list view renders; file_url is never shown here
+                query = (
+                    select(Proposal)
+                    .options(load_only(
+                        Proposal.proposal_id, Proposal.status, Proposal.proposal_type, Proposal.user_id,
+                        Proposal.final_name, Proposal.llm_suggestion, Proposal.original_text, Proposal.created_at
+                    ))
+                    .where(*filters)
+                    .order_by(desc(Proposal.created_at))
+                    .limit(limit)
+                )
                 result = await session.execute(query)
                 proposals = result.scalars().all()
+                
+                if proposals:
+                    # Count the whole filtered population in the database, not just this page
+                    counts_query = (
+                        select(Proposal.status, Proposal.proposal_type, func.count())
+                        .where(*filters)
+                        .group_by(Proposal.status, Proposal.proposal_type)
+                    )
+                    count_rows = (await session.execute(counts_query)).all()
             
             if not proposals:
                 await interaction.followup.send(
@@ -274,13 +361,13 @@ class AdminEmojiManagementCog(commands.Cog):
                 )
                 return
             
-            # Calculate summary statistics
+            # Fold the grouped counts into per-status and per-type totals
             status_counts = {}
             type_counts = {}
             
-            for proposal in proposals:
-                status_counts[proposal.status] = status_counts.get(proposal.status, 0) + 1
-                type_counts[proposal.proposal_type] = type_counts.get(proposal.proposal_type, 0) + 1
+            for row_status, row_type, count in count_rows:
+                status_counts[row_status] = status_counts.get(row_status, 0) + count
+                type_counts[row_type] = type_counts.get(row_type, 0) + count
             
             # Create embed
             embed = discord.Embed(
@@ -298,12 +385,7 @@ class AdminEmojiManagementCog(commands.Cog):
             # Add summary statistics
             status_summary = []
             for status_name, count in status_counts.items():
-                emoji = {
-                    'pending': '🟡',
-                    'approved': '✅',
-                    'rejected': '❌',
-                    'needs_changes': '🔄'
-                }.get(status_name, '❓')
+                emoji = _STATUS_EMOJI.get(status_name, '❓')
                 status_summary.append(f"{emoji} {status_name.replace('_', ' ').title()}: {count}")
             
             embed.add_field(
@@ -315,7 +397,7 @@ class AdminEmojiManagementCog(commands.Cog):
             # Add type statistics
             type_summary = []
             for type_name, count in type_counts.items():
-                emoji = '🎨' if type_name == 'emoji' else '💬'
+                emoji = _TYPE_EMOJI.get(type_name, '💬')
                 type_summary.append(f"{emoji} {type_name.title()}: {count}")
             
             embed.add_field(
@@ -329,14 +411,8 @@ class AdminEmojiManagementCog(commands.Cog):
             # Show detailed proposal list
             proposal_lines = []
             for proposal in proposals[:10]:  # Show max 10 proposals
-                status_emoji = {
-                    'pending': '🟡',
-                    'approved': '✅',
-                    'rejected': '❌',
-                    'needs_changes': '🔄'
-                }.get(proposal.status, '❓')
-                
-                type_emoji = '🎨' if proposal.proposal_type == 'emoji' else '💬'
+                status_emoji = _STATUS_EMOJI.get(proposal.status, '❓')
+                type_emoji = _TYPE_EMOJI.get(proposal.proposal_type, '💬')
                 created_date = proposal.created_at.strftime('%m/%d %H:%M')
                 
                 # Build proposal line
@@ -378,10 +454,10 @@ class AdminEmojiManagementCog(commands.Cog):
             
             await interaction.followup.send(embed=embed, ephemeral=True)
             
-            self.logger.info(f"[admin_emoji_management.list_proposals] Proposal list requested by {interaction.user.id}")
+            self.logger.info("[admin_emoji_management.list_proposals] Proposal list requested by %s", interaction.user.id)
             
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management.list_proposals] Error listing proposals: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management.list_proposals] Error listing proposals: %s", e, exc_info=True)
             await interaction.followup.send(
                 "❌ **Error**: Failed to list proposals. Please try again later.",
                 ephemeral=True
@@ -394,16 +470,7 @@ class AdminEmojiManagementCog(commands.Cog):
         current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for proposal types."""
-        types = [
-            ('Emoji', 'emoji'),
-            ('Channel', 'channel')
-        ]
-        
-        return [
-            app_commands.Choice(name=name, value=value)
-            for name, value in types
-            if current.lower() in name.lower()
-        ]
+        return filter_choices(_TYPE_CHOICES, current)
     
     @list_proposals.autocomplete('status')
     async def status_autocomplete(
@@ -412,18 +479,7 @@ class AdminEmojiManagementCog(commands.Cog):
         current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for proposal statuses."""
-        statuses = [
-            ('Pending', 'pending'),
-            ('Approved', 'approved'),
-            ('Rejected', 'rejected'),
-            ('Needs Changes', 'needs_changes')
-        ]
-        
-        return [
-            app_commands.Choice(name=name, value=value)
-            for name, value in statuses
-            if current.lower() in name.lower()
-        ]
+        return filter_choices(_STATUS_CHOICES, current)
     
     @app_commands.command(name="get_proposal", description="Get detailed information about a specific proposal")
     @app_commands.describe(proposal_id="ID of the proposal to view")
@@ -433,11 +489,7 @@ class AdminEmojiManagementCog(commands.Cog):
         
         try:
             async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select
-                result = await session.execute(
-                    select(Proposal).where(Proposal.proposal_id == proposal_id)
-                )
-                proposal = result.scalar_one_or_none()
+                proposal = await session.get(Proposal, proposal_id)
                 
                 if not proposal:
                     await interaction.followup.send(
@@ -447,31 +499,20 @@ class AdminEmojiManagementCog(commands.Cog):
                     return
             
             # Create detailed embed
-            status_colors = {
-                'pending': 0xffa500,
-                'approved': 0x00ff00,
-                'rejected': 0xff0000,
-                'needs_changes': 0xff9900
-            }
-            
-            status_emoji = {
-                'pending': '🟡',
-                'approved': '✅',
-                'rejected': '❌',
-                'needs_changes': '🔄'
-            }.get(proposal.status, '❓')
+            status_emoji = _STATUS_EMOJI.get(proposal.status, '❓')
             
             embed = discord.Embed(
                 title=f"{status_emoji} Proposal Details - ID: {proposal_id}",
                 description=f"**Status**: {proposal.status.replace('_', ' ').title()}",
-                color=status_colors.get(proposal.status, 0x888888),
+                color=_STATUS_COLORS.get(proposal.status, 0x888888),
                 timestamp=proposal.created_at
             )
             
             # Basic information
             embed.add_field(name="Type", value=proposal.proposal_type.title(), inline=True)
             embed.add_field(name="Proposer", value=f"<@{proposal.user_id}>", inline=True)
-            embed.add_field(name="Created", value=f"<t:{int(proposal.created_at.timestamp())}:R>", inline=True)
+            created = f"<t:{int(proposal.created_at.timestamp())}:R>"
+            embed.add_field(name="Created", value=created, inline=True)
             
             # Proposal content
             if proposal.proposal_type == 'emoji':
@@ -506,10 +547,10 @@ class AdminEmojiManagementCog(commands.Cog):
             
             # Admin information
             if proposal.status != 'pending':
-                embed.add_field(name="Created", value=f"<t:{int(proposal.created_at.timestamp())}:R>", inline=True)
+                embed.add_field(name="Created", value=created, inline=True)
             
             # Action buttons for pending proposals and those needing changes
-            if proposal.status in ['pending', 'needs_changes']:
+            if proposal.status in _REVIEWABLE_STATUSES:
                 embed.add_field(
                     name="Available Actions",
                     value="Use `/review_proposal` to approve, reject, or request changes",
@@ -520,42 +561,38 @@ class AdminEmojiManagementCog(commands.Cog):
             
             await interaction.followup.send(embed=embed, ephemeral=True)
             
-            self.logger.info(f"[admin_emoji_management.get_proposal] Proposal {proposal_id} viewed by {interaction.user.id}")
+            self.logger.info("[admin_emoji_management.get_proposal] Proposal %s viewed by %s", proposal_id, interaction.user.id)
             
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management.get_proposal] Error getting proposal {proposal_id}: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management.get_proposal] Error getting proposal %s: %s", proposal_id, e, exc_info=True)
             await interaction.followup.send(
                 "❌ **Error**: Failed to retrieve proposal. Please try again later.",
                 ephemeral=True
             )
     
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Drop cached channels if they are deleted."""
+        if self._proposed_category is not None and channel.id == self._proposed_category.id:
+            self._proposed_category = None
+        if channel.id == self._announcement_channel_id:
+            self._announcement_channel_cache = None
+    
+    async def _mark_needs_changes(self, proposal_id: int):
+        """Set a proposal back to needs_changes with a single UPDATE, without reloading it."""
+        from sqlalchemy import update
+        async with self.bot.db_manager.get_pg_session() as session:
+            await session.execute(
+                update(Proposal)
+                .where(Proposal.proposal_id == proposal_id)
+                .values(status='needs_changes')
+            )
+            await session.commit()
+        self.bot.dispatch('proposals_changed')
+    
     def _validate_emoji_name(self, name: str) -> bool:
         """Validate emoji name according to Discord requirements."""
-        if not name or len(name) < 2 or len(name) > 32:
-            return False
-        
-        allowed_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
-        if not all(c in allowed_chars for c in name):
-            return False
-        
-        return True
-    
-    def _validate_channel_name(self, name: str) -> bool:
-        """Validate channel name according to Discord requirements (allows emojis and special chars)."""
-        if not name or len(name) < 1 or len(name) > 100:
-            return False
-        
-        # Discord channels allow emojis and many special characters
-        # Main restrictions: no spaces (replaced with hyphens), reasonable length
-        # The emoji・name format should be allowed
-        
-        # Check for basic validity - allow emojis, special chars, but not just whitespace
-        cleaned = name.strip()
-        if not cleaned:
-            return False
-        
-        # Allow the emoji・name format and other valid Discord channel patterns
-        return True
+        return name is not None and _EMOJI_NAME_RE.match(name) is not None
     
     async def _create_emoji(self, proposal: Proposal, guild: discord.Guild) -> bool:
         """Create the emoji in the guild."""
@@ -563,15 +600,29 @@ class AdminEmojiManagementCog(commands.Cog):
             # Get the emoji name to use
             emoji_name = proposal.final_name or proposal.llm_suggestion or proposal.original_text
             
-            # Download the image
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.get(proposal.file_url) as response:
-                    if response.status != 200:
-                        self.logger.error(f"[admin_emoji_management._create_emoji] Failed to download emoji file: HTTP {response.status}")
-                        return False
-                    
-                    image_data = await response.read()
+            # Download the image over the bot's pooled HTTP session
+            async with self.bot.http_session.get(proposal.file_url) as response:
+                if response.status != 200:
+                    self.logger.error("[admin_emoji_management._create_emoji] Failed to download emoji file: HTTP %s", response.status)
+                    return False
+                
+                # Refuse oversized images before buffering them or calling the Discord API
+                size = response.content_length
+                if size is not None and size > _MAX_EMOJI_BYTES:
+                    self.logger.error("[admin_emoji_management._create_emoji] Emoji file too large: %s bytes", size)
+                    return False
+                
+                # Content-Length is the decoded size only when the body is not content-encoded
+                if size is not None and 'Content-Encoding' not in response.headers:
+                    image_data = await response.content.readexactly(size)
+                else:
+                    buffer = bytearray()
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        buffer += chunk
+                        if len(buffer) > _MAX_EMOJI_BYTES:
+                            self.logger.error("[admin_emoji_management._create_emoji] Emoji file too large: over 256 KiB")
+                            return False
+                    image_data = bytes(buffer)
             
             # Create the emoji
             emoji = await guild.create_custom_emoji(
@@ -580,14 +631,14 @@ class AdminEmojiManagementCog(commands.Cog):
                 reason=f"Approved emoji proposal #{proposal.proposal_id}"
             )
             
-            self.logger.info(f"[admin_emoji_management._create_emoji] Created emoji :{emoji_name}: (ID: {emoji.id})")
+            self.logger.info("[admin_emoji_management._create_emoji] Created emoji :%s: (ID: %s)", emoji_name, emoji.id)
             return True
             
         except discord.HTTPException as e:
-            self.logger.error(f"[admin_emoji_management._create_emoji] Discord API error creating emoji: {e}")
+            self.logger.error("[admin_emoji_management._create_emoji] Discord API error creating emoji: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management._create_emoji] Error creating emoji: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management._create_emoji] Error creating emoji: %s", e, exc_info=True)
             return False
     
     async def _create_channel(self, proposal: Proposal, guild: discord.Guild) -> bool:
@@ -599,13 +650,16 @@ class AdminEmojiManagementCog(commands.Cog):
             # Clean and validate channel name
             channel_name = self._clean_channel_name(channel_name)
             if not self._validate_channel_name(channel_name):
-                self.logger.error(f"[admin_emoji_management._create_channel] Invalid channel name: {channel_name}")
+                self.logger.error("[admin_emoji_management._create_channel] Invalid channel name: %s", channel_name)
                 return False
             
-            # Get the proposed category
-            proposed_category = guild.get_channel(self.bot.proposed_channel_category_id)
+            # Get the proposed category, cached until it is deleted
+            proposed_category = self._proposed_category
+            if proposed_category is None or proposed_category.guild.id != guild.id:
+                proposed_category = guild.get_channel(self.bot.proposed_channel_category_id)
+                self._proposed_category = proposed_category
             if not proposed_category:
-                self.logger.error(f"[admin_emoji_management._create_channel] Proposed category not found")
+                self.logger.error("[admin_emoji_management._create_channel] Proposed category not found")
                 return False
             
             # Create the channel
@@ -625,22 +679,24 @@ class AdminEmojiManagementCog(commands.Cog):
             )
             
             welcome_embed.add_field(name="Proposed by", value=f"<@{proposal.user_id}>", inline=True)
-            welcome_embed.add_field(name="Channel Purpose", value=proposal.original_text[:500] + "..." if len(proposal.original_text) > 500 else proposal.original_text, inline=False)
+            # Shared by the welcome message and the public announcement
+            purpose = _trunc(proposal.original_text, 500)
+            welcome_embed.add_field(name="Channel Purpose", value=purpose, inline=False)
             welcome_embed.set_footer(text="This channel can be promoted to permanent status based on activity")
             
             await channel.send(embed=welcome_embed)
             
             # Send public announcement
-            await self._send_channel_announcement(proposal, channel)
+            await self._send_channel_announcement(proposal, channel, purpose)
             
-            self.logger.info(f"[admin_emoji_management._create_channel] Created channel #{channel_name} (ID: {channel.id})")
+            self.logger.info("[admin_emoji_management._create_channel] Created channel #%s (ID: %s)", channel_name, channel.id)
             return True
             
         except discord.HTTPException as e:
-            self.logger.error(f"[admin_emoji_management._create_channel] Discord API error creating channel: {e}")
+            self.logger.error("[admin_emoji_management._create_channel] Discord API error creating channel: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management._create_channel] Error creating channel: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management._create_channel] Error creating channel: %s", e, exc_info=True)
             return False
     
     def _clean_channel_name(self, name: str) -> str:
@@ -659,11 +715,10 @@ class AdminEmojiManagementCog(commands.Cog):
         cleaned = cleaned.replace(' ', '-')
         
         # Remove invalid characters (keep only alphanumeric, hyphens, underscores for name part)
-        import re
-        cleaned = re.sub(r'[^a-z0-9\-_]', '', cleaned)
+        cleaned = cleaned.translate(_NAME_TRANSLATION)
         
         # Remove consecutive hyphens/underscores
-        cleaned = re.sub(r'[-_]+', '-', cleaned)
+        cleaned = _RE_COLLAPSE_SEP.sub('-', cleaned)
         
         # Remove leading/trailing hyphens
         cleaned = cleaned.strip('-_')
@@ -677,59 +732,43 @@ class AdminEmojiManagementCog(commands.Cog):
     
     def _validate_channel_name(self, name: str) -> bool:
         """Validate channel name according to Discord requirements and emoji・name format."""
-        if not name or len(name) < 1 or len(name) > 100:
+        if not name or not 1 <= len(name) <= 100:
             return False
         
-        # Check for emoji・name format
-        if '・' in name:
-            parts = name.split('・', 1)
-            if len(parts) != 2:
-                return False
-            
-            emoji_part = parts[0].strip()
-            name_part = parts[1].strip()
+        # Check for emoji・name format; one scan finds the separator without splitting
+        separator = name.find('・')
+        if separator != -1:
+            emoji_part = name[:separator].strip()
+            name_part = name[separator + 1:].strip()
             
             # Validate emoji part (should be 1-4 characters, likely emoji)
             if not emoji_part or len(emoji_part) > 4:
                 return False
             
             # Validate name part (Discord channel naming rules)
-            if not name_part:
-                return False
-            
-            import re
-            if not re.match(r'^[a-z0-9\-_]+$', name_part):
-                return False
-            
-            # Can't start or end with hyphen
-            if name_part.startswith('-') or name_part.endswith('-'):
-                return False
-            
-            return True
+            return _RE_DISCORD_NAME.fullmatch(name_part) is not None
         else:
             # Fallback validation for plain names
-            import re
-            if not re.match(r'^[a-z0-9\-_]+$', name):
-                return False
-            
-            # Can't start or end with hyphen
-            if name.startswith('-') or name.endswith('-'):
-                return False
-            
-            return True
+            return _RE_DISCORD_NAME.fullmatch(name) is not None
     
-    async def _send_channel_announcement(self, proposal: Proposal, channel: discord.TextChannel):
+    def _get_announcement_channel(self) -> Optional[discord.TextChannel]:
+        """Return the public announcement channel, resolving it until it has been found."""
+        if not self._announcement_channel_id:
+            self.logger.warning("[admin_emoji_management._get_announcement_channel] No public announcement channel configured")
+            return None
+        
+        if self._announcement_channel_cache is None:
+            self._announcement_channel_cache = self.bot.get_channel(self._announcement_channel_id)
+            if not self._announcement_channel_cache:
+                self.logger.warning("[admin_emoji_management._get_announcement_channel] Public announcement channel not found")
+        return self._announcement_channel_cache
+    
+    async def _send_channel_announcement(self, proposal: Proposal, channel: discord.TextChannel, purpose: str):
         """Send public announcement about new channel creation."""
         try:
             # Get public announcement channel
-            announcement_channel_id = getattr(self.bot, 'public_announcement_channel_id', None)
-            if not announcement_channel_id:
-                self.logger.warning("[admin_emoji_management._send_channel_announcement] No public announcement channel configured")
-                return
-            
-            announcement_channel = self.bot.get_channel(announcement_channel_id)
+            announcement_channel = self._get_announcement_channel()
             if not announcement_channel:
-                self.logger.warning("[admin_emoji_management._send_channel_announcement] Public announcement channel not found")
                 return
             
             # Create embed for channel announcement
@@ -740,45 +779,28 @@ class AdminEmojiManagementCog(commands.Cog):
                 timestamp=discord.utils.utcnow()
             )
             
-            embed.add_field(
-                name="👤 Proposed by",
-                value=f"<@{proposal.user_id}>",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📝 Channel Purpose",
-                value=proposal.original_text[:500] + "..." if len(proposal.original_text) > 500 else proposal.original_text,
-                inline=False
-            )
-            
-            embed.add_field(
-                name="💡 Next Steps",
-                value="Check it out and join the conversation! Active channels may be promoted to permanent status based on community engagement.",
-                inline=False
+            _add_fields(
+                embed,
+                ("👤 Proposed by", f"<@{proposal.user_id}>", True),
+                ("📝 Channel Purpose", purpose, False),
+                ("💡 Next Steps", "Check it out and join the conversation! Active channels may be promoted to permanent status based on community engagement.", False),
             )
             
             embed.set_footer(text="Community-driven channel creation")
             
             await announcement_channel.send(embed=embed)
             
-            self.logger.info(f"[admin_emoji_management._send_channel_announcement] Public announcement sent for channel {channel.name}")
+            self.logger.info("[admin_emoji_management._send_channel_announcement] Public announcement sent for channel %s", channel.name)
             
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management._send_channel_announcement] Error sending announcement: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management._send_channel_announcement] Error sending announcement: %s", e, exc_info=True)
     
     async def _send_emoji_announcement(self, proposal: Proposal):
         """Send public announcement about new emoji creation."""
         try:
             # Get public announcement channel
-            announcement_channel_id = getattr(self.bot, 'public_announcement_channel_id', None)
-            if not announcement_channel_id:
-                self.logger.warning("[admin_emoji_management._send_emoji_announcement] No public announcement channel configured")
-                return
-            
-            announcement_channel = self.bot.get_channel(announcement_channel_id)
+            announcement_channel = self._get_announcement_channel()
             if not announcement_channel:
-                self.logger.warning("[admin_emoji_management._send_emoji_announcement] Public announcement channel not found")
                 return
             
             # Get emoji name
@@ -792,24 +814,14 @@ class AdminEmojiManagementCog(commands.Cog):
                 timestamp=discord.utils.utcnow()
             )
             
-            embed.add_field(
-                name="👤 Proposed by",
-                value=f"<@{proposal.user_id}>",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="😊 Emoji Name",
-                value=f":{emoji_name}:",
-                inline=True
+            _add_fields(
+                embed,
+                ("👤 Proposed by", f"<@{proposal.user_id}>", True),
+                ("😊 Emoji Name", f":{emoji_name}:", True),
             )
             
             if proposal.original_text and proposal.original_text != emoji_name:
-                embed.add_field(
-                    name="📝 Description",
-                    value=proposal.original_text[:300] + "..." if len(proposal.original_text) > 300 else proposal.original_text,
-                    inline=False
-                )
+                embed.add_field(name="📝 Description", value=_trunc(proposal.original_text, 300), inline=False)
             
             embed.add_field(
                 name="🎉 Usage",
@@ -821,10 +833,10 @@ class AdminEmojiManagementCog(commands.Cog):
             
             await announcement_channel.send(embed=embed)
             
-            self.logger.info(f"[admin_emoji_management._send_emoji_announcement] Public announcement sent for emoji :{emoji_name}:")
+            self.logger.info("[admin_emoji_management._send_emoji_announcement] Public announcement sent for emoji :%s:", emoji_name)
             
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management._send_emoji_announcement] Error sending announcement: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management._send_emoji_announcement] Error sending announcement: %s", e, exc_info=True)
     
     async def _notify_proposer(
         self,
@@ -838,30 +850,21 @@ class AdminEmojiManagementCog(commands.Cog):
         try:
             proposer = self.bot.get_user(proposal.user_id)
             if not proposer:
-                self.logger.warning(f"[admin_emoji_management._notify_proposer] Proposer {proposal.user_id} not found")
+                self.logger.warning("[admin_emoji_management._notify_proposer] Proposer %s not found", proposal.user_id)
                 return
             
-            action_color = {
-                'approved': 0x00ff00,
-                'rejected': 0xff0000,
-                'needs_changes': 0xff9900
-            }.get(action, 0x888888)
-            
-            action_messages = {
-                'approved': "Your proposal has been **approved**! 🎉",
-                'rejected': "Your proposal has been **rejected**",
-                'needs_changes': "Your proposal **needs changes** before it can be approved"
-            }
-            
             embed = discord.Embed(
                 title=f"🎨 Proposal Update - ID: {proposal.proposal_id}",
-                description=action_messages.get(action, f"Your proposal status has been updated to **{action}**"),
-                color=action_color,
+                description=_ACTION_MESSAGES.get(action) or f"Your proposal status has been updated to **{action}**",
+                color=_STATUS_COLORS.get(action, 0x888888),
                 timestamp=discord.utils.utcnow()
             )
             
-            embed.add_field(name="Proposal Type", value=proposal.proposal_type.title(), inline=True)
-            embed.add_field(name="Status", value=action.replace('_', ' ').title(), inline=True)
+            _add_fields(
+                embed,
+                ("Proposal Type", proposal.proposal_type.title(), True),
+                ("Status", action.replace('_', ' ').title(), True),
+            )
             
             if proposal.proposal_type == 'emoji':
                 emoji_name = final_name or proposal.llm_suggestion or proposal.original_text
@@ -876,28 +879,21 @@ class AdminEmojiManagementCog(commands.Cog):
                 embed.add_field(name="Administrator Response", value=response, inline=False)
             
             # Set appropriate footer based on action
-            if action == 'approved':
-                if proposal.proposal_type == 'emoji':
-                    footer_text = "Your emoji has been added to the server! Thank you for contributing."
-                elif proposal.proposal_type == 'channel':
-                    footer_text = "Your channel has been created! Thank you for contributing to the community."
-                else:
-                    footer_text = "Thank you for your contribution to the server!"
-            elif action == 'needs_changes':
-                footer_text = "You can submit a new proposal with the requested changes."
-            else:
-                footer_text = "Thank you for your interest in contributing to the server."
-            
+            footer_text = (
+                _FOOTER_TEXT.get((action, proposal.proposal_type))
+                or _FOOTER_TEXT.get((action, None))
+                or _DEFAULT_FOOTER_TEXT
+            )
             embed.set_footer(text=footer_text)
             
             try:
                 await proposer.send(embed=embed)
-                self.logger.info(f"[admin_emoji_management._notify_proposer] Notification sent to proposer {proposal.user_id}")
+                self.logger.info("[admin_emoji_management._notify_proposer] Notification sent to proposer %s", proposal.user_id)
             except discord.Forbidden:
-                self.logger.warning(f"[admin_emoji_management._notify_proposer] Cannot DM proposer {proposal.user_id}")
+                self.logger.warning("[admin_emoji_management._notify_proposer] Cannot DM proposer %s", proposal.user_id)
             
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management._notify_proposer] Error notifying proposer: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management._notify_proposer] Error notifying proposer: %s", e, exc_info=True)
     
     async def _send_admin_log(
         self,
@@ -913,11 +909,7 @@ class AdminEmojiManagementCog(commands.Cog):
             if not admin_channel:
                 return
             
-            action_emoji = {
-                'approved': '✅',
-                'rejected': '❌',
-                'needs_changes': '🔄'
-            }.get(action, '📋')
+            action_emoji = _STATUS_EMOJI.get(action, '📋')
             
             embed = discord.Embed(
                 title=f"{action_emoji} Proposal {action.replace('_', ' ').title()} - ID: {proposal.proposal_id}",
@@ -925,9 +917,12 @@ class AdminEmojiManagementCog(commands.Cog):
                 timestamp=discord.utils.utcnow()
             )
             
-            embed.add_field(name="Type", value=proposal.proposal_type.title(), inline=True)
-            embed.add_field(name="Proposer", value=f"<@{proposal.user_id}>", inline=True)
-            embed.add_field(name="Admin", value=admin.mention, inline=True)
+            _add_fields(
+                embed,
+                ("Type", proposal.proposal_type.title(), True),
+                ("Proposer", f"<@{proposal.user_id}>", True),
+                ("Admin", admin.mention, True),
+            )
             
             if proposal.proposal_type == 'emoji':
                 emoji_name = final_name or proposal.llm_suggestion or proposal.original_text
@@ -937,24 +932,26 @@ class AdminEmojiManagementCog(commands.Cog):
                 embed.add_field(name="Channel Name", value=f"#{channel_name}", inline=True)
             
             if response:
-                embed.add_field(name="Response", value=response[:500] + "..." if len(response) > 500 else response, inline=False)
+                embed.add_field(name="Response", value=_trunc(response, 500), inline=False)
             
             await admin_channel.send(embed=embed)
             
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management._send_admin_log] Error sending admin log: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management._send_admin_log] Error sending admin log: %s", e, exc_info=True)
     
     async def _update_proposal_queue_embed(self):
         """Update the persistent proposal queue embed."""
         try:
-            # Import method from user emoji proposals cog to avoid code duplication
-            from cogs.user_emoji_proposals import UserEmojiProposalsCog
-            user_proposals_cog = self.bot.get_cog('UserEmojiProposalsCog')
+            # Reuse the user emoji proposals cog's queue renderer; held weakly so reloads rebind
+            user_proposals_cog = self._user_proposals_cog() if self._user_proposals_cog else None
+            if user_proposals_cog is None:
+                user_proposals_cog = self.bot.get_cog('UserEmojiProposalsCog')
+                self._user_proposals_cog = weakref.ref(user_proposals_cog) if user_proposals_cog else None
             if user_proposals_cog:
                 await user_proposals_cog._update_proposal_queue_embed()
             
         except Exception as e:
-            self.logger.error(f"[admin_emoji_management._update_proposal_queue_embed] Error updating queue: {e}", exc_info=True)
+            self.logger.error("[admin_emoji_management._update_proposal_queue_embed] Error updating queue: %s", e, exc_info=True)
 
 
 async def setup(bot):
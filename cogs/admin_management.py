@@ -5,9 +5,11 @@ This cog handles administrative functions for managing channels, including
 promoting channels from proposed to permanent and recalculating statistics.
 """
 
+import asyncio
 import logging
-import os
-from datetime import datetime, timedelta
+from array import array
+from datetime import datetime, timedelta, timezone
+from itertools import chain
 from typing import Optional
 
 import discord
@@ -16,13 +18,86 @@ from discord.ext import commands
 
 from database.db_models import TrackedChannel
 
+_PROMOTION_TEMPLATE_PATH = '/app/templates/promoted_channel_announcement.md'
+
+# Used when the promotion announcement template file is not available
+_DEFAULT_PROMOTION_TEMPLATE = """🎉 **Channel Promoted to Permanent!**
+
+{channel_mention} has been promoted to permanent status due to high community engagement!
+
+**Promoted by:** {admin_mention}
+
+This channel has shown excellent activity and will now be part of our permanent channel lineup. Keep up the great conversations!
+"""
+
+
+def _add_inline_fields(embed: discord.Embed, fields) -> discord.Embed:
+    """Add (name, value) pairs to an embed as inline fields, in order."""
+    add_field = embed.add_field
+    for name, value in fields:
+        add_field(name=name, value=value, inline=True)
+    return embed
+
+
+def _embed(title: str, color: int, fields=(), description: Optional[str] = None) -> discord.Embed:
+    """Build a timestamped embed with the given inline (name, value) fields."""
+    embed = discord.Embed(title=title, description=description, color=color, timestamp=discord.utils.utcnow())
+    return _add_inline_fields(embed, fields)
+
 
 class AdminManagementCog(commands.Cog):
     """Cog for administrative channel management functionality."""
     
+    # Recalculation pipeline: history pages are queued while batches are written to Redis
+    RECALC_PAGE_SIZE = 100  # matches discord.py's history request size
+    RECALC_QUEUE_PAGES = 20
+    RECALC_FLUSH_INTERVAL = 0.05  # seconds to wait for a batch to fill before writing it
+    ADMIN_LOG_DRAIN_TIMEOUT = 10.0  # seconds to spend sending queued admin logs on unload
+    
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger('cogs.admin_management')
+        self._promotion_template = self._load_promotion_template()
+        # Report channels live in the tracked categories but are never scored
+        self._report_channel_ids = frozenset((
+            bot.proposed_activity_report_channel_id,
+            bot.permanent_activity_report_channel_id,
+        ))
+    
+    async def cog_load(self):
+        """Start the worker that sends admin log messages off the command path."""
+        self._log_queue = asyncio.Queue()
+        self._log_worker = asyncio.create_task(self._drain_admin_logs())
+    
+    async def cog_unload(self):
+        """Let the admin log worker finish what is queued, then stop it."""
+        self._log_queue.put_nowait(None)
+        done, _ = await asyncio.wait({self._log_worker}, timeout=self.ADMIN_LOG_DRAIN_TIMEOUT)
+        if not done:
+            self._log_worker.cancel()
+    
+    async def _drain_admin_logs(self):
+        """Send queued admin log messages in order until the stop sentinel arrives."""
+        queue = self._log_queue
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            send, args = item
+            await send(*args)
+    
+    def _queue_admin_log(self, send, *args):
+        """Queue an admin log send; the worker awaits it so commands don't have to."""
+        self._log_queue.put_nowait((send, args))
+    
+    def _load_promotion_template(self) -> str:
+        """Read the promotion announcement template once, falling back to the built-in text."""
+        try:
+            with open(_PROMOTION_TEMPLATE_PATH, 'r') as f:
+                return f.read()
+        except FileNotFoundError:
+            self.logger.warning("[admin_management._load_promotion_template] %s not found, using default template", _PROMOTION_TEMPLATE_PATH)
+            return _DEFAULT_PROMOTION_TEMPLATE
     
     def cog_check(self, ctx):
         """Check if user has admin permissions."""
@@ -39,7 +114,7 @@ class AdminManagementCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            self.logger.info(f"[admin_management.promote_channel] Channel {channel.id} promotion requested by {interaction.user.id}")
+            self.logger.info("[admin_management.promote_channel] Channel %s promotion requested by %s", channel.id, interaction.user.id)
             
             # Verify channel is in proposed category
             if channel.category_id != self.bot.proposed_channel_category_id:
@@ -62,43 +137,46 @@ class AdminManagementCog(commands.Cog):
             old_category_name = channel.category.name if channel.category else "No Category"
             await channel.edit(category=permanent_category, reason=f"Promoted by {interaction.user}")
             
-            # Update tracked channels in database
-            await self._update_channel_tracking(channel.id, 'proposed', 'permanent')
-            
-            # Send confirmation to admin
-            embed = discord.Embed(
-                title="✅ Channel Promoted",
-                description=f"{channel.mention} has been promoted to permanent status!",
-                color=0x00ff00,
-                timestamp=discord.utils.utcnow()
-            )
-            
-            embed.add_field(name="Channel", value=channel.mention, inline=True)
-            embed.add_field(name="Promoted by", value=interaction.user.mention, inline=True)
-            embed.add_field(name="Previous Category", value=old_category_name, inline=True)
-            
-            # Get channel statistics
-            if hasattr(self.bot.db_manager, 'redis_stats'):
-                stats = await self.bot.db_manager.redis_stats.get_channel_stats(channel.id)
-                score = await self.bot.db_manager.redis_stats.calculate_channel_score(channel.id)
-                recent_count = await self.bot.db_manager.redis_stats.get_recent_message_count(channel.id, 7)
-                
-                embed.add_field(name="Total Messages", value=f"{stats['total_messages']:,}", inline=True)
-                embed.add_field(name="Recent Messages (7d)", value=f"{recent_count:,}", inline=True)
-                embed.add_field(name="Activity Score", value=f"{score:.1f}", inline=True)
-            
-            await interaction.followup.send(embed=embed, ephemeral=True)
-            
-            # Send public announcement
-            await self._send_promotion_announcement(channel, interaction.user)
-            
-            # Send admin log
-            await self._send_admin_log(channel, interaction.user, "promoted")
-            
-            self.logger.info(f"[admin_management.promote_channel] Channel {channel.id} promoted by {interaction.user.id}")
+            # Confirm to the admin as soon as the move succeeds
+            embed = _embed("✅ Channel Promoted", 0x00ff00, (
+                ("Channel", channel.mention),
+                ("Promoted by", interaction.user.mention),
+                ("Previous Category", old_category_name),
+            ), description=f"{channel.mention} has been promoted to permanent status!")
+            
+            message = await interaction.followup.send(embed=embed, ephemeral=True)
+            
+            # Admin logging happens in the background worker
+            self._queue_admin_log(self._send_admin_log, channel, interaction.user, "promoted")
+            
+            # Update tracking, announce and fetch channel statistics concurrently
+            steps = {
+                'tracking update': self._update_channel_tracking(channel.id, 'permanent'),
+                'announcement': self._send_promotion_announcement(channel, interaction.user),
+            }
+            redis_stats = self.bot.redis_stats
+            if redis_stats is not None:
+                steps['statistics'] = redis_stats.get_channel_snapshot(channel.id, 7)
+            
+            results = dict(zip(steps, await asyncio.gather(*steps.values(), return_exceptions=True)))
+            for step, result in results.items():
+                if isinstance(result, Exception):
+                    self.logger.error("[admin_management.promote_channel] Promotion %s failed for channel %s: %s", step, channel.id, result)
+            
+            # Add channel statistics to the confirmation once they arrive
+            snapshot = results.get('statistics')
+            if isinstance(snapshot, dict):
+                _add_inline_fields(embed, (
+                    ("Total Messages", f"{snapshot['total_messages']:,}"),
+                    ("Recent Messages (7d)", f"{snapshot['recent_messages']:,}"),
+                    ("Activity Score", f"{snapshot['score']:.1f}"),
+                ))
+                await message.edit(embed=embed)
+            
+            self.logger.info("[admin_management.promote_channel] Channel %s promoted by %s", channel.id, interaction.user.id)
             
         except Exception as e:
-            self.logger.error(f"[admin_management.promote_channel] Error promoting channel {channel.id}: {e}", exc_info=True)
+            self.logger.error("[admin_management.promote_channel] Error promoting channel %s: %s", channel.id, e, exc_info=True)
             await interaction.followup.send(
                 "❌ **Error**: Failed to promote channel. Please try again later.",
                 ephemeral=True
@@ -106,11 +184,13 @@ class AdminManagementCog(commands.Cog):
     
     @app_commands.command(name="recalculate_stats", description="Recalculate activity statistics for tracked channels")
     @app_commands.describe(
-        months_back="Number of months to look back for recalculation (default: 1, max from config)"
+        months_back="Number of months to look back for recalculation (default: 1, max from config)",
+        rebuild="Discard existing stats and replay the full lookback period (default: catch up from last recorded message)"
     )
-    async def recalculate_stats(self, interaction: discord.Interaction, months_back: int = 1):
+    async def recalculate_stats(self, interaction: discord.Interaction, months_back: int = 1, rebuild: bool = False):
         """Command to recalculate channel activity statistics."""
-        await interaction.response.defer(ephemeral=True)
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
         
         try:
             # Validate months_back parameter
@@ -120,31 +200,24 @@ class AdminManagementCog(commands.Cog):
             elif months_back < 1:
                 months_back = 1
             
-            self.logger.info(f"[admin_management.recalculate_stats] Stats recalculation requested by {interaction.user.id} for {months_back} months")
+            self.logger.info("[admin_management.recalculate_stats] Stats recalculation requested by %s for %s months", interaction.user.id, months_back)
             
-            # Get all tracked channels
-            tracked_channels = []
-            
-            # Get channels from both categories
+            # Get channels from both categories in one pass, excluding report channels
             proposed_category = self.bot.get_channel(self.bot.proposed_channel_category_id)
             permanent_category = self.bot.get_channel(self.bot.permanent_channel_category_id)
             
-            if proposed_category:
-                tracked_channels.extend(proposed_category.text_channels)
-            
-            if permanent_category:
-                tracked_channels.extend(permanent_category.text_channels)
-            
-            # Exclude report channels
-            proposed_report_channel_id = int(os.getenv('PROPOSED_ACTIVITY_REPORT_CHANNEL_ID', '0'))
-            permanent_report_channel_id = int(os.getenv('PERMANENT_ACTIVITY_REPORT_CHANNEL_ID', '0'))
-            
-            original_count = len(tracked_channels)
-            tracked_channels = [ch for ch in tracked_channels 
-                              if ch.id not in [proposed_report_channel_id, permanent_report_channel_id]]
-            excluded_count = original_count - len(tracked_channels)
+            report_channel_ids = self._report_channel_ids
+            tracked_channels = []
+            excluded_count = 0
+            for ch in chain(getattr(proposed_category, 'text_channels', ()),
+                            getattr(permanent_category, 'text_channels', ())):
+                if ch.id in report_channel_ids:
+                    excluded_count += 1
+                else:
+                    tracked_channels.append(ch)
+            original_count = len(tracked_channels) + excluded_count
             
-            self.logger.info(f"[admin_management.recalculate_stats] Found {original_count} channels, excluded {excluded_count} report channels, processing {len(tracked_channels)}")
+            self.logger.info("[admin_management.recalculate_stats] Found %s channels, excluded %s report channels, processing %s", original_count, excluded_count, len(tracked_channels))
             
             if not tracked_channels:
                 await interaction.followup.send(
@@ -153,69 +226,78 @@ class AdminManagementCog(commands.Cog):
                 )
                 return
             
+            # Calculate cutoff date
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=30 * months_back)
+            
+            # Refuse runs whose history paging would stall on Discord rate limits
+            max_pages = self.bot.stats_recalc_max_pages
+            estimated_pages = await self._estimate_history_pages(tracked_channels, cutoff_date, rebuild)
+            if max_pages and estimated_pages > max_pages:
+                self.logger.warning("[admin_management.recalculate_stats] Skipped: ~%s history pages estimated, limit %s", estimated_pages, max_pages)
+                await interaction.followup.send(
+                    f"⚠️ **Too Large**: Recalculating {months_back} month(s) would need about {estimated_pages:,} "
+                    f"Discord history requests (limit {max_pages:,}). Try a smaller `months_back`.",
+                    ephemeral=True
+                )
+                return
+            
             # Send initial response
-            embed = discord.Embed(
-                title="🔄 Recalculating Statistics",
-                description=f"Processing {len(tracked_channels)} channels from tracked categories (excluding report channels)...",
-                color=0xff9900,
-                timestamp=discord.utils.utcnow()
-            )
-            embed.add_field(name="Lookback Period", value=f"{months_back} month(s)", inline=True)
-            embed.add_field(name="Status", value="In Progress...", inline=True)
-            embed.add_field(name="Excluded", value=f"{excluded_count} report channels", inline=True)
+            embed = _embed("🔄 Recalculating Statistics", 0xff9900, (
+                ("Lookback Period", f"{months_back} month(s)"),
+                ("Status", "In Progress..."),
+                ("Excluded", f"{excluded_count} report channels"),
+            ), description=f"Processing {len(tracked_channels)} channels from tracked categories (excluding report channels)...")
             
             await interaction.followup.send(embed=embed, ephemeral=True)
             
-            # Calculate cutoff date
-            cutoff_date = datetime.utcnow() - timedelta(days=30 * months_back)
+            # Write out buffered live increments so catch-up starts from current stats
+            await self.bot.flush_message_buffer()
             
-            # Process each channel
-            processed_count = 0
-            error_count = 0
+            # Process channels concurrently, bounded so history fetches share the rate limit
+            sem = asyncio.Semaphore(max(1, self.bot.stats_recalc_concurrency))
             
-            for channel in tracked_channels:
-                try:
-                    await self._recalculate_channel_stats(channel, cutoff_date)
-                    processed_count += 1
-                except Exception as e:
-                    self.logger.error(f"[admin_management.recalculate_stats] Error processing channel {channel.id}: {e}")
-                    error_count += 1
+            async def _recalculate_one(channel):
+                async with sem:
+                    try:
+                        await self._recalculate_channel_stats(channel, cutoff_date, rebuild)
+                        return True
+                    except Exception as e:
+                        self.logger.error("[admin_management.recalculate_stats] Error processing channel %s: %s", channel.id, e)
+                        return False
             
-            # Send completion response
-            embed = discord.Embed(
-                title="✅ Statistics Recalculation Complete",
-                description="Channel statistics have been recalculated for tracked categories only\n📊 Activity reports have been updated",
-                color=0x00ff00,
-                timestamp=discord.utils.utcnow()
-            )
+            results = await asyncio.gather(*(_recalculate_one(channel) for channel in tracked_channels))
+            processed_count = sum(results)
+            error_count = len(results) - processed_count
             
-            embed.add_field(name="Channels Processed", value=f"{processed_count}", inline=True)
-            embed.add_field(name="Errors", value=f"{error_count}", inline=True)
-            embed.add_field(name="Excluded", value=f"{excluded_count} report channels", inline=True)
-            embed.add_field(name="Lookback Period", value=f"{months_back} month(s)", inline=True)
-            embed.add_field(name="Processed by", value=interaction.user.mention, inline=True)
+            # Send completion response
+            embed = _embed("✅ Statistics Recalculation Complete", 0x00ff00, (
+                ("Channels Processed", f"{processed_count}"),
+                ("Errors", f"{error_count}"),
+                ("Excluded", f"{excluded_count} report channels"),
+                ("Lookback Period", f"{months_back} month(s)"),
+                ("Processed by", interaction.user.mention),
+            ), description="Channel statistics have been recalculated for tracked categories only\n📊 Activity reports have been updated")
             
             await interaction.edit_original_response(embed=embed)
             
             # Send admin log
-            await self._send_admin_log_stats(interaction.user, processed_count, error_count, months_back)
+            self._queue_admin_log(self._send_admin_log_stats, interaction.user, processed_count, error_count, months_back)
             
             # Update activity reports after recalculation
             try:
                 tasks_cog = self.bot.get_cog('BackgroundTasksCog')
                 if tasks_cog:
-                    await tasks_cog._update_proposed_activity_report()
-                    await tasks_cog._update_permanent_activity_report()
+                    await tasks_cog.update_activity_reports()
                     self.logger.info("[admin_management.recalculate_stats] Activity reports updated after recalculation")
                 else:
                     self.logger.warning("[admin_management.recalculate_stats] BackgroundTasksCog not found, skipping report update")
             except Exception as e:
-                self.logger.error(f"[admin_management.recalculate_stats] Error updating reports: {e}")
+                self.logger.error("[admin_management.recalculate_stats] Error updating reports: %s", e)
             
-            self.logger.info(f"[admin_management.recalculate_stats] Completed: {processed_count} processed, {error_count} errors")
+            self.logger.info("[admin_management.recalculate_stats] Completed: %s processed, %s errors", processed_count, error_count)
             
         except Exception as e:
-            self.logger.error(f"[admin_management.recalculate_stats] Error during recalculation: {e}", exc_info=True)
+            self.logger.error("[admin_management.recalculate_stats] Error during recalculation: %s", e, exc_info=True)
             await interaction.followup.send(
                 "❌ **Error**: Failed to recalculate statistics. Please try again later.",
                 ephemeral=True
@@ -224,130 +306,105 @@ class AdminManagementCog(commands.Cog):
     @app_commands.command(name="refresh_channels", description="Refresh channel tracking and force update activity reports")
     async def refresh_channels(self, interaction: discord.Interaction):
         """Command to refresh channel tracking and update reports."""
-        await interaction.response.defer(ephemeral=True)
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
         
         try:
-            self.logger.info(f"[admin_management.refresh_channels] Channel refresh requested by {interaction.user.id}")
+            self.logger.info("[admin_management.refresh_channels] Channel refresh requested by %s", interaction.user.id)
             
             # Update tracked channels in database
             proposed_category = self.bot.get_channel(self.bot.proposed_channel_category_id)
             permanent_category = self.bot.get_channel(self.bot.permanent_channel_category_id)
             
-            current_channels = set()
-            
-            if proposed_category:
-                for channel in proposed_category.text_channels:
-                    current_channels.add((channel.id, 'proposed'))
-            
-            if permanent_category:
-                for channel in permanent_category.text_channels:
-                    current_channels.add((channel.id, 'permanent'))
+            # Map each channel to its category; a channel appears under exactly one
+            current_channels = {
+                channel.id: category_type
+                for category_type, category in (('proposed', proposed_category), ('permanent', permanent_category))
+                if category
+                for channel in category.text_channels
+            }
             
-            # Update database
+            # Update database; the diff against existing rows is computed by Postgres
+            added = moved = 0
             async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select, delete
+                from sqlalchemy import delete, literal_column
+                from sqlalchemy.dialects.postgresql import insert as pg_insert
                 
-                # Get existing tracked channels
-                result = await session.execute(select(TrackedChannel))
-                existing_channels = {(tc.channel_id, tc.category) for tc in result.scalars().all()}
-                
-                # Find channels to add and remove
-                to_add = current_channels - existing_channels
-                to_remove = existing_channels - current_channels
-                
-                # Add new channels
-                for channel_id, category in to_add:
-                    tracked_channel = TrackedChannel(
-                        channel_id=channel_id,
-                        category=category
+                # Upsert every current channel. Only inserted rows and category changes
+                # are returned; xmax is 0 for a freshly inserted row.
+                if current_channels:
+                    stmt = pg_insert(TrackedChannel).values(
+                        [{'channel_id': cid, 'category': cat} for cid, cat in current_channels.items()]
                     )
-                    session.add(tracked_channel)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[TrackedChannel.channel_id],
+                        set_={'category': stmt.excluded.category},
+                        where=TrackedChannel.category != stmt.excluded.category
+                    ).returning(literal_column('xmax = 0').label('inserted'))
+                    for inserted in (await session.execute(stmt)).scalars():
+                        if inserted:
+                            added += 1
+                        else:
+                            moved += 1
                 
-                # Remove old channels
-                for channel_id, category in to_remove:
-                    await session.execute(
-                        delete(TrackedChannel).where(
-                            TrackedChannel.channel_id == channel_id,
-                            TrackedChannel.category == category
-                        )
-                    )
+                # Remove channels no longer in either category
+                result = await session.execute(
+                    delete(TrackedChannel)
+                    .where(TrackedChannel.channel_id.not_in(list(current_channels)))
+                    .returning(TrackedChannel.channel_id)
+                )
+                removed = len(result.all())
                 
                 await session.commit()
             
             # Force update activity reports
             tasks_cog = self.bot.get_cog('BackgroundTasksCog')
             if tasks_cog:
-                await tasks_cog._update_proposed_activity_report()
-                await tasks_cog._update_permanent_activity_report()
+                await tasks_cog.update_activity_reports()
             
             # Send response
-            embed = discord.Embed(
-                title="✅ Channels Refreshed",
-                description="Channel tracking and activity reports have been updated",
-                color=0x00ff00,
-                timestamp=discord.utils.utcnow()
-            )
-            
-            embed.add_field(name="Channels Added", value=f"{len(to_add)}", inline=True)
-            embed.add_field(name="Channels Removed", value=f"{len(to_remove)}", inline=True)
-            embed.add_field(name="Total Tracked", value=f"{len(current_channels)}", inline=True)
-            embed.add_field(name="Refreshed by", value=interaction.user.mention, inline=True)
+            embed = _embed("✅ Channels Refreshed", 0x00ff00, (
+                ("Channels Added", f"{added}"),
+                ("Channels Removed", f"{removed}"),
+                ("Channels Moved", f"{moved}"),
+                ("Total Tracked", f"{len(current_channels)}"),
+                ("Refreshed by", interaction.user.mention),
+            ), description="Channel tracking and activity reports have been updated")
             
             await interaction.followup.send(embed=embed, ephemeral=True)
             
-            self.logger.info(f"[admin_management.refresh_channels] Completed: {len(to_add)} added, {len(to_remove)} removed")
+            self.logger.info("[admin_management.refresh_channels] Completed: %s added, %s removed, %s moved", added, removed, moved)
             
         except Exception as e:
-            self.logger.error(f"[admin_management.refresh_channels] Error during refresh: {e}", exc_info=True)
+            self.logger.error("[admin_management.refresh_channels] Error during refresh: %s", e, exc_info=True)
             await interaction.followup.send(
                 "❌ **Error**: Failed to refresh channels. Please try again later.",
                 ephemeral=True
             )
     
-    async def _update_channel_tracking(self, channel_id: int, old_category: str, new_category: str):
+    async def _update_channel_tracking(self, channel_id: int, new_category: str):
         """Update channel tracking in database."""
         try:
             async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select, delete
+                from sqlalchemy.dialects.postgresql import insert as pg_insert
                 
-                # Remove old tracking record
+                # Move the tracking record to its new category, creating it if missing
+                stmt = pg_insert(TrackedChannel).values(channel_id=channel_id, category=new_category)
                 await session.execute(
-                    delete(TrackedChannel).where(
-                        TrackedChannel.channel_id == channel_id,
-                        TrackedChannel.category == old_category
+                    stmt.on_conflict_do_update(
+                        index_elements=[TrackedChannel.channel_id],
+                        set_={'category': stmt.excluded.category}
                     )
                 )
                 
-                # Add new tracking record
-                tracked_channel = TrackedChannel(
-                    channel_id=channel_id,
-                    category=new_category
-                )
-                session.add(tracked_channel)
-                
                 await session.commit()
                 
         except Exception as e:
-            self.logger.error(f"[admin_management._update_channel_tracking] Error updating tracking for channel {channel_id}: {e}")
+            self.logger.error("[admin_management._update_channel_tracking] Error updating tracking for channel %s: %s", channel_id, e)
     
     async def _send_promotion_announcement(self, channel: discord.TextChannel, admin: discord.Member):
         """Send public announcement about channel promotion."""
         try:
-            # Try to load promotion announcement template
-            try:
-                with open('/app/templates/promoted_channel_announcement.md', 'r') as f:
-                    template = f.read()
-            except FileNotFoundError:
-                # Fallback template
-                template = """🎉 **Channel Promoted to Permanent!**
-
-{channel_mention} has been promoted to permanent status due to high community engagement!
-
-**Promoted by:** {admin_mention}
-
-This channel has shown excellent activity and will now be part of our permanent channel lineup. Keep up the great conversations!
-"""
-            
             # Get public announcement channel
             announcement_channel = self.bot.get_channel(self.bot.public_announcement_channel_id)
             if not announcement_channel:
@@ -355,7 +412,7 @@ This channel has shown excellent activity and will now be part of our permanent
                 return
             
             # Format template
-            formatted_message = template.format(
+            formatted_message = self._promotion_template.format(
                 channel_mention=channel.mention,
                 admin_mention=admin.mention,
                 channel_name=channel.name
@@ -363,10 +420,10 @@ This channel has shown excellent activity and will now be part of our permanent
             
             await announcement_channel.send(formatted_message)
             
-            self.logger.info(f"[admin_management._send_promotion_announcement] Promotion announcement sent for channel {channel.name}")
+            self.logger.info("[admin_management._send_promotion_announcement] Promotion announcement sent for channel %s", channel.name)
             
         except Exception as e:
-            self.logger.error(f"[admin_management._send_promotion_announcement] Error sending announcement: {e}", exc_info=True)
+            self.logger.error("[admin_management._send_promotion_announcement] Error sending announcement: %s", e, exc_info=True)
     
     async def _send_admin_log(self, channel: discord.TextChannel, admin: discord.Member, action: str):
         """Send admin log message about channel action."""
@@ -375,27 +432,25 @@ This channel has shown excellent activity and will now be part of our permanent
             if not admin_channel:
                 return
             
-            embed = discord.Embed(
-                title=f"🔄 Channel {action.title()}",
-                color=0x9b59b6,
-                timestamp=discord.utils.utcnow()
-            )
-            
-            embed.add_field(name="Channel", value=channel.mention, inline=True)
-            embed.add_field(name="Admin", value=admin.mention, inline=True)
-            embed.add_field(name="Action", value=action.title(), inline=True)
+            embed = _embed(f"🔄 Channel {action.title()}", 0x9b59b6, (
+                ("Channel", channel.mention),
+                ("Admin", admin.mention),
+                ("Action", action.title()),
+            ))
             
             # Add statistics if available
-            if hasattr(self.bot.db_manager, 'redis_stats'):
-                stats = await self.bot.db_manager.redis_stats.get_channel_stats(channel.id)
-                score = await self.bot.db_manager.redis_stats.calculate_channel_score(channel.id)
-                embed.add_field(name="Activity Score", value=f"{score:.1f}", inline=True)
-                embed.add_field(name="Total Messages", value=f"{stats['total_messages']:,}", inline=True)
+            redis_stats = self.bot.redis_stats
+            if redis_stats is not None:
+                snapshot = await redis_stats.get_channel_snapshot(channel.id, 7)
+                _add_inline_fields(embed, (
+                    ("Activity Score", f"{snapshot['score']:.1f}"),
+                    ("Total Messages", f"{snapshot['total_messages']:,}"),
+                ))
             
             await admin_channel.send(embed=embed)
             
         except Exception as e:
-            self.logger.error(f"[admin_management._send_admin_log] Error sending admin log: {e}", exc_info=True)
+            self.logger.error("[admin_management._send_admin_log] Error sending admin log: %s", e, exc_info=True)
     
     async def _send_admin_log_stats(self, admin: discord.Member, processed: int, errors: int, months: int):
         """Send admin log about statistics recalculation."""
@@ -404,47 +459,145 @@ This channel has shown excellent activity and will now be part of our permanent
             if not admin_channel:
                 return
             
-            embed = discord.Embed(
-                title="📊 Statistics Recalculated",
-                color=0x9b59b6,
-                timestamp=discord.utils.utcnow()
-            )
-            
-            embed.add_field(name="Admin", value=admin.mention, inline=True)
-            embed.add_field(name="Processed", value=f"{processed} channels", inline=True)
-            embed.add_field(name="Errors", value=f"{errors}", inline=True)
-            embed.add_field(name="Lookback", value=f"{months} month(s)", inline=True)
+            embed = _embed("📊 Statistics Recalculated", 0x9b59b6, (
+                ("Admin", admin.mention),
+                ("Processed", f"{processed} channels"),
+                ("Errors", f"{errors}"),
+                ("Lookback", f"{months} month(s)"),
+            ))
             
             await admin_channel.send(embed=embed)
             
         except Exception as e:
-            self.logger.error(f"[admin_management._send_admin_log_stats] Error sending admin log: {e}", exc_info=True)
+            self.logger.error("[admin_management._send_admin_log_stats] Error sending admin log: %s", e, exc_info=True)
     
-    async def _recalculate_channel_stats(self, channel: discord.TextChannel, cutoff_date: datetime):
-        """Recalculate statistics for a single channel."""
+    async def _estimate_history_pages(self, channels, cutoff_date: datetime, rebuild: bool) -> int:
+        """
+        Estimate the Discord history requests a recalculation would make.
+        
+        Each channel's 7-day message rate is extrapolated over the span it would
+        page: the full lookback for a replay, or since its last recorded message
+        for a catch-up. Every channel costs at least one request.
+        """
+        redis_stats = self.bot.redis_stats
+        if redis_stats is None:
+            return 0
+        
+        snapshots = await redis_stats.get_channels_snapshot_bulk([ch.id for ch in channels], 7)
+        now = discord.utils.utcnow().timestamp()
+        cutoff_ts = cutoff_date.timestamp()
+        
+        pages = 0
+        for snapshot in snapshots.values():
+            last_ts = 0 if rebuild else snapshot['last_message_timestamp']
+            span_days = (now - max(cutoff_ts, last_ts)) / 86400
+            pages += 1 + int(snapshot['recent_messages'] / 7 * span_days) // self.RECALC_PAGE_SIZE
+        return pages
+    
+    async def _recalculate_channel_stats(self, channel: discord.TextChannel, cutoff_date: datetime, rebuild: bool = False):
+        """
+        Recalculate statistics for a single channel.
+        
+        Channels that already have stats are caught up from their last recorded
+        message; history since cutoff_date is replayed from scratch only when no
+        stats exist yet or a rebuild is requested.
+        """
         try:
-            if not hasattr(self.bot.db_manager, 'redis_stats'):
+            redis_stats = self.bot.redis_stats
+            if redis_stats is None:
                 return
             
-            # Clear existing stats
-            await self.bot.db_manager.redis_stats.clear_channel_stats(channel.id)
-            
-            # Fetch messages and recalculate
-            message_count = 0
-            async for message in channel.history(limit=None, after=cutoff_date):
-                if not message.author.bot:
-                    timestamp = int(message.created_at.timestamp())
-                    await self.bot.db_manager.redis_stats.increment_channel_messages(
-                        channel.id,
-                        message.id,
-                        timestamp
-                    )
-                    message_count += 1
+            last_ts = 0 if rebuild else (await redis_stats.get_channel_stats(channel.id))['last_message_timestamp']
+            replaced = False
+            
+            if last_ts:
+                # Incremental catch-up on top of the live counters
+                after = max(cutoff_date, datetime.fromtimestamp(last_ts, timezone.utc))
+                write = redis_stats.merge_delta
+            else:
+                # Full replay: the first batch atomically replaces the existing stats
+                after = cutoff_date
+                
+                async def write(channel_id, ids, stamps):
+                    nonlocal replaced
+                    if replaced:
+                        await redis_stats.increment_channel_messages_bulk(channel_id, ids, stamps)
+                    else:
+                        await redis_stats.init_and_ingest(channel_id, ids, stamps)
+                        replaced = True
+            
+            # Fetch history and write to Redis concurrently: the producer queues pages
+            # of message IDs and timestamps while the consumer flushes them in batches
+            batch_size = self.bot.stats_recalc_batch_size
+            page_size = self.RECALC_PAGE_SIZE
+            queue = asyncio.Queue(maxsize=self.RECALC_QUEUE_PAGES)
+            loop = asyncio.get_running_loop()
+            
+            async def produce():
+                # Oldest first so each batch advances last_message_timestamp monotonically
+                ids, stamps = array('q'), array('q')
+                fetched = 0
+                async for message in channel.history(limit=None, after=after, oldest_first=True):
+                    fetched += 1
+                    if not message.author.bot:
+                        ids.append(message.id)
+                        stamps.append(int(message.created_at.timestamp()))
+                    # Hand off at Discord page boundaries; bot messages never await otherwise
+                    if fetched == page_size:
+                        fetched = 0
+                        if ids:
+                            await queue.put((ids, stamps))
+                            ids, stamps = array('q'), array('q')
+                if ids:
+                    await queue.put((ids, stamps))
+                await queue.put(None)
+            
+            async def consume():
+                written = 0
+                finished = False
+                while not finished:
+                    page = await queue.get()
+                    if page is None:
+                        break
+                    ids, stamps = page
+                    deadline = loop.time() + self.RECALC_FLUSH_INTERVAL
+                    while len(ids) < batch_size:
+                        try:
+                            page = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                        except asyncio.TimeoutError:
+                            break
+                        if page is None:
+                            finished = True
+                            break
+                        ids.extend(page[0])
+                        stamps.extend(page[1])
+                    await write(channel.id, ids, stamps)
+                    written += len(ids)
+                return written
+            
+            tasks = (asyncio.create_task(produce()), asyncio.create_task(consume()))
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for task in tasks:
+                if not task.cancelled() and task.exception():
+                    raise task.exception()
+            message_count = tasks[1].result()
+            
+            # A replay that found no messages still has to clear the old stats
+            if not last_ts and not replaced:
+                await redis_stats.init_and_ingest(channel.id, (), ())
             
-            self.logger.debug(f"[admin_management._recalculate_channel_stats] Recalculated {message_count} messages for channel {channel.id}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("[admin_management._recalculate_channel_stats] %s %s messages for channel %s",
+                                  'Caught up' if last_ts else 'Replayed', message_count, channel.id)
             
         except Exception as e:
-            self.logger.error(f"[admin_management._recalculate_channel_stats] Error recalculating channel {channel.id}: {e}")
+            self.logger.error("[admin_management._recalculate_channel_stats] Error recalculating channel %s: %s", channel.id, e)
             raise
 
 
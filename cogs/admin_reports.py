@@ -5,23 +5,115 @@ This cog handles admin functionality for reviewing, responding to,
 and managing user-submitted reports.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
+from sqlalchemy import bindparam, desc, func, select, update
+from sqlalchemy.engine import Row
 
+from cogs.choices import build_choices, filter_choices
 from database.db_models import Report
 
+# Reports are read as plain Core rows: handlers only read their columns, so
+# skipping ORM hydration and identity-map bookkeeping is pure savings
+_REPORTS = Report.__table__
+
+# Report statuses that close a report; closed reports cannot be reviewed again
+_CLOSED_STATUSES = ('resolved', 'dismissed')
+
+# Display lookups for list and detail embeds
+_STATUS_EMOJI = {
+    'pending': '🟡',
+    'resolved': '✅',
+    'dismissed': '❌',
+    'escalated': '🔺',
+    'investigating': '🔍'
+}
+_TYPE_DISPLAY = {
+    'user_behavior': 'User Behavior',
+    'spam': 'Spam',
+    'harassment': 'Harassment',
+    'inappropriate_content': 'Inappropriate Content',
+    'technical_issue': 'Technical Issue',
+    'other': 'Other'
+}
+
+
+def _type_display(report_type: str) -> str:
+    """Human-readable name for a report type, title-casing unknown types."""
+    display = _TYPE_DISPLAY.get(report_type)
+    return display if display is not None else report_type.replace('_', ' ').title()
+
+
+def _fmt(dt: datetime) -> str:
+    """Short MM/DD HH:MM timestamp for list rows (same as strftime('%m/%d %H:%M'), without its overhead)."""
+    return f"{dt.month:02d}/{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+# Static autocomplete options; handlers only filter these by the typed text
+_ACTION_CHOICES = build_choices(
+    ('Resolved', 'resolved'),
+    ('Dismissed', 'dismissed'),
+    ('Escalated', 'escalated'),
+    ('Investigating', 'investigating')
+)
+_STATUS_CHOICES = build_choices(('Pending', 'pending')) + _ACTION_CHOICES
+_REPORT_TYPE_CHOICES = build_choices(*((name, value) for value, name in _TYPE_DISPLAY.items()))
+
+
+# Columns shown by list_reports; the potentially long description stays in get_report
+_LIST_COLUMNS = (
+    _REPORTS.c.id,
+    _REPORTS.c.status,
+    _REPORTS.c.report_type,
+    _REPORTS.c.reporter_id,
+    _REPORTS.c.reported_user_id,
+    _REPORTS.c.admin_id,
+    _REPORTS.c.admin_response,
+    _REPORTS.c.resolved_at,
+    _REPORTS.c.created_at
+)
+
+# Statements built once and reused with fresh bind parameters, so every call
+# hits the same compiled SQL and the connection's prepared-statement cache
+_SELECT_REPORT = select(_REPORTS).where(_REPORTS.c.id == bindparam('report_id'))
+_REVIEW_REPORT = (
+    update(_REPORTS)
+    .where(_REPORTS.c.id == bindparam('report_id'), _REPORTS.c.status.not_in(_CLOSED_STATUSES))
+    .values(
+        status=bindparam('action'),
+        admin_id=bindparam('reviewer_id'),
+        admin_response=bindparam('response'),
+        resolved_at=bindparam('reviewed_at')
+    )
+    .returning(_REPORTS)
+)
+
 
 class AdminReportsCog(commands.Cog):
     """Cog for admin report management functionality."""
     
+    # Recently read reports, served without a database round-trip. This cog is the
+    # only writer of existing reports, so review_report keeps the cache current.
+    REPORT_CACHE_TTL = 60.0
+    REPORT_CACHE_SIZE = 512
+    
+    # Users fetched from the API when missing from the client cache, so repeated
+    # notifications to the same reporter don't repeat the REST call
+    USER_CACHE_TTL = 600.0
+    USER_CACHE_SIZE = 2048
+    
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger('cogs.admin_reports')
+        self._report_cache: dict[int, tuple[float, Row]] = {}
+        self._user_cache: dict[int, tuple[float, discord.User]] = {}
     
     def cog_check(self, ctx):
         """Check if user has admin permissions."""
@@ -31,6 +123,54 @@ class AdminReportsCog(commands.Cog):
         """Check if user has admin permissions for slash commands."""
         return self.bot.has_admin_permissions(interaction.user)
     
+    async def _fetch_report(self, session, report_id: int) -> Optional[Row]:
+        """Get a report row by ID, serving recent reads from the in-process cache."""
+        cached = self._report_cache.get(report_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        result = await session.execute(_SELECT_REPORT, {'report_id': report_id})
+        report = result.first()
+        if report is not None:
+            self._cache_report(report)
+        return report
+    
+    async def _fetch_all(self, statement) -> list[Row]:
+        """Run a read-only statement on its own session so callers can gather several."""
+        async with self.bot.db_manager.get_pg_session() as session:
+            result = await session.execute(statement)
+            return result.all()
+    
+    def _cache_report(self, report: Row):
+        """Store a report row in the cache, evicting the oldest entry when full."""
+        cache = self._report_cache
+        cache.pop(report.id, None)
+        if len(cache) >= self.REPORT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[report.id] = (time.monotonic() + self.REPORT_CACHE_TTL, report)
+    
+    async def _get_user(self, user_id: int) -> Optional[discord.User]:
+        """Get a user from the client cache, falling back to a cached API fetch."""
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user
+        
+        cache = self._user_cache
+        cached = cache.get(user_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        try:
+            user = await self.bot.fetch_user(user_id)
+        except discord.NotFound:
+            return None
+        
+        cache.pop(user_id, None)
+        if len(cache) >= self.USER_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[user_id] = (time.monotonic() + self.USER_CACHE_TTL, user)
+        return user
+    
     @app_commands.command(name="review_report", description="Review and take action on a user report")
     @app_commands.describe(
         report_id="ID of the report to review",
@@ -59,37 +199,41 @@ class AdminReportsCog(commands.Cog):
                 )
                 return
             
-            # Get report from database
             async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select
-                result = await session.execute(
-                    select(Report).where(Report.id == report_id)
-                )
-                report = result.scalar_one_or_none()
+                # Update the report unless it is already closed, reading back the updated row.
+                # Only truly final states are blocked (resolved/dismissed are final closure).
+                result = await session.execute(_REVIEW_REPORT, {
+                    'report_id': report_id,
+                    'action': action,
+                    'reviewer_id': interaction.user.id,
+                    'response': response,
+                    'reviewed_at': datetime.utcnow()
+                })
+                report = result.first()
                 
-                if not report:
-                    await interaction.followup.send(
-                        f"❌ **Error**: Report ID `{report_id}` not found.",
-                        ephemeral=True
-                    )
+                if report is None:
+                    # Nothing updated: tell a missing report from a closed one, reading
+                    # past the cache since a cached row may predate the closure
+                    self._report_cache.pop(report_id, None)
+                    existing = await self._fetch_report(session, report_id)
+                    if not existing:
+                        await interaction.followup.send(
+                            f"❌ **Error**: Report ID `{report_id}` not found.",
+                            ephemeral=True
+                        )
+                    else:
+                        await interaction.followup.send(
+                            f"❌ **Error**: Report `{report_id}` has already been {existing.status} and is closed. Use a new report if needed.",
+                            ephemeral=True
+                        )
                     return
                 
-                # Only block truly final states (resolved/dismissed are final closure)
-                if report.status in ['resolved', 'dismissed']:
-                    await interaction.followup.send(
-                        f"❌ **Error**: Report `{report_id}` has already been {report.status} and is closed. Use a new report if needed.",
-                        ephemeral=True
-                    )
-                    return
-                
-                # Update report status
-                report.status = action
-                report.admin_id = interaction.user.id
-                report.admin_response = response
-                report.resolved_at = datetime.utcnow()
-                
                 await session.commit()
             
+            # Keep the cache in step with the row just written
+            self._cache_report(report)
+            self.bot.dispatch('reports_changed')
+            
             # Send confirmation to admin
             embed = discord.Embed(
                 title="✅ Report Reviewed",
@@ -98,7 +242,7 @@ class AdminReportsCog(commands.Cog):
                 timestamp=discord.utils.utcnow()
             )
             
-            embed.add_field(name="Report Type", value=report.report_type.replace('_', ' ').title(), inline=True)
+            embed.add_field(name="Report Type", value=_type_display(report.report_type), inline=True)
             embed.add_field(name="Reporter", value=f"<@{report.reporter_id}>", inline=True)
             embed.add_field(name="Reviewed By", value=interaction.user.mention, inline=True)
             
@@ -118,15 +262,20 @@ class AdminReportsCog(commands.Cog):
             
             await interaction.followup.send(embed=embed, ephemeral=True)
             
-            # Send notification to reporter when there's a response or for final actions
+            # Follow-up side effects are independent Discord calls, so run them together;
+            # one failing (e.g. a missing log channel) must not hold up the others
+            steps = {
+                'queue embed update': self._update_report_queue_embed(),
+                'admin log': self._send_admin_log(report, action, response, interaction.user),
+            }
+            # Notify the reporter when there's a response or for final actions
             if response or action in ['resolved', 'dismissed', 'escalated']:
-                await self._notify_reporter(report, action, response, interaction.user)
+                steps['reporter notification'] = self._notify_reporter(report, action, response, interaction.user)
             
-            # Update report queue embed
-            await self._update_report_queue_embed()
-            
-            # Send admin log
-            await self._send_admin_log(report, action, response, interaction.user)
+            results = await asyncio.gather(*steps.values(), return_exceptions=True)
+            for step, result in zip(steps, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"[admin_reports.review_report] Report {report_id} {step} failed: {result}")
             
             self.logger.info(f"[admin_reports.review_report] Report {report_id} marked as {action} by {interaction.user.id}")
             
@@ -144,18 +293,7 @@ class AdminReportsCog(commands.Cog):
         current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for report actions."""
-        actions = [
-            ('Resolved', 'resolved'),
-            ('Dismissed', 'dismissed'),
-            ('Escalated', 'escalated'),
-            ('Investigating', 'investigating')
-        ]
-        
-        return [
-            app_commands.Choice(name=name, value=value)
-            for name, value in actions
-            if current.lower() in name.lower()
-        ][:25]  # Discord limit
+        return filter_choices(_ACTION_CHOICES, current)
     
     @app_commands.command(name="list_reports", description="List reports with filtering options")
     @app_commands.describe(
@@ -179,19 +317,30 @@ class AdminReportsCog(commands.Cog):
             elif limit < 1:
                 limit = 1
             
-            # Build query
-            async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select, desc
-                query = select(Report).order_by(desc(Report.created_at)).limit(limit)
-                
-                if status:
-                    query = query.where(Report.status == status)
-                
-                if report_type:
-                    query = query.where(Report.report_type == report_type)
-                
-                result = await session.execute(query)
-                reports = result.scalars().all()
+            # Shared filter for the listing and its summary aggregates
+            filters = []
+            if status:
+                filters.append(_REPORTS.c.status == status)
+            if report_type:
+                filters.append(_REPORTS.c.report_type == report_type)
+            
+            # Fetch the listing and aggregate in SQL concurrently, each on its own session
+            report_count = func.count().label('count')
+            reports, status_counts, admin_counts = await asyncio.gather(
+                self._fetch_all(
+                    select(*_LIST_COLUMNS).where(*filters).order_by(desc(_REPORTS.c.created_at)).limit(limit)
+                ),
+                self._fetch_all(
+                    select(_REPORTS.c.status, report_count).where(*filters).group_by(_REPORTS.c.status)
+                ),
+                self._fetch_all(
+                    select(_REPORTS.c.admin_id, report_count)
+                    .where(_REPORTS.c.admin_id.is_not(None), *filters)
+                    .group_by(_REPORTS.c.admin_id)
+                    .order_by(desc(report_count))
+                    .limit(5)
+                )
+            )
             
             if not reports:
                 await interaction.followup.send(
@@ -200,18 +349,6 @@ class AdminReportsCog(commands.Cog):
                 )
                 return
             
-            # Calculate summary statistics
-            status_counts = {}
-            admin_counts = {}
-            
-            for report in reports:
-                # Count by status
-                status_counts[report.status] = status_counts.get(report.status, 0) + 1
-                
-                # Count by admin (for handled reports)
-                if report.admin_id:
-                    admin_counts[report.admin_id] = admin_counts.get(report.admin_id, 0) + 1
-            
             # Create embed
             embed = discord.Embed(
                 title="📋 Reports List",
@@ -223,18 +360,12 @@ class AdminReportsCog(commands.Cog):
             if status:
                 embed.description += f" with status: **{status}**"
             if report_type:
-                embed.description += f" of type: **{report_type.replace('_', ' ').title()}**"
+                embed.description += f" of type: **{_type_display(report_type)}**"
             
             # Add summary statistics
             status_summary = []
-            for status_name, count in status_counts.items():
-                emoji = {
-                    'pending': '🟡',
-                    'resolved': '✅', 
-                    'dismissed': '❌',
-                    'escalated': '🔺',
-                    'investigating': '🔍'
-                }.get(status_name, '❓')
+            for status_name, count in status_counts:
+                emoji = _STATUS_EMOJI.get(status_name, '❓')
                 status_summary.append(f"{emoji} {status_name.title()}: {count}")
             
             embed.add_field(
@@ -246,12 +377,12 @@ class AdminReportsCog(commands.Cog):
             # Add admin statistics if there are handled reports
             if admin_counts:
                 admin_summary = []
-                for admin_id, count in admin_counts.items():
+                for admin_id, count in admin_counts:
                     admin_summary.append(f"<@{admin_id}>: {count}")
                 
                 embed.add_field(
                     name="👥 Handled by Admins",
-                    value="\n".join(admin_summary[:5]),  # Show top 5 admins
+                    value="\n".join(admin_summary),  # Top 5 admins, already limited in SQL
                     inline=True
                 )
             
@@ -259,45 +390,32 @@ class AdminReportsCog(commands.Cog):
             
             report_lines = []
             for report in reports:
-                status_emoji = {
-                    'pending': '🟡',
-                    'resolved': '✅', 
-                    'dismissed': '❌',
-                    'escalated': '🔺',
-                    'investigating': '🔍'
-                }.get(report.status, '❓')
+                status_emoji = _STATUS_EMOJI.get(report.status, '❓')
                 
-                created_date = report.created_at.strftime('%m/%d %H:%M')
-                report_type_display = report.report_type.replace('_', ' ').title()
+                created_date = _fmt(report.created_at)
+                report_type_display = _type_display(report.report_type)
                 
                 # Build the report line with more detail
-                line = f"{status_emoji} `{report.id}` **{report_type_display}**"
-                
-                # Reporter info
-                line += f"\n   📝 Reporter: <@{report.reporter_id}>"
-                
-                # Reported user info (if applicable)
-                if report.reported_user_id:
-                    line += f" → <@{report.reported_user_id}>"
-                
-                # Admin assignment info
+                reported = f" → <@{report.reported_user_id}>" if report.reported_user_id else ""
                 if report.admin_id:
-                    resolved_date = ""
-                    if report.resolved_at:
-                        resolved_date = f" on {report.resolved_at.strftime('%m/%d %H:%M')}"
-                    line += f"\n   👤 Handled by: <@{report.admin_id}>{resolved_date}"
+                    resolved_date = f" on {_fmt(report.resolved_at)}" if report.resolved_at else ""
+                    assignment = f"   👤 Handled by: <@{report.admin_id}>{resolved_date}"
                 else:
-                    line += f"\n   👤 Unassigned"
+                    assignment = "   👤 Unassigned"
                 
-                # Creation date
-                line += f"\n   📅 Created: {created_date}"
+                parts = [
+                    f"{status_emoji} `{report.id}` **{report_type_display}**",
+                    f"   📝 Reporter: <@{report.reporter_id}>{reported}",
+                    assignment,
+                    f"   📅 Created: {created_date}",
+                ]
                 
                 # Add admin response if available
                 if report.admin_response:
                     response_preview = report.admin_response[:50] + "..." if len(report.admin_response) > 50 else report.admin_response
-                    line += f"\n   💬 Response: \"{response_preview}\""
+                    parts.append(f"   💬 Response: \"{response_preview}\"")
                 
-                report_lines.append(line)
+                report_lines.append("\n".join(parts))
             
             # Split into multiple fields if too many reports to avoid embed limits
             if len(reports) <= 5:
@@ -345,19 +463,7 @@ class AdminReportsCog(commands.Cog):
         current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for report status."""
-        statuses = [
-            ('Pending', 'pending'),
-            ('Resolved', 'resolved'),
-            ('Dismissed', 'dismissed'),
-            ('Escalated', 'escalated'),
-            ('Investigating', 'investigating')
-        ]
-        
-        return [
-            app_commands.Choice(name=name, value=value)
-            for name, value in statuses
-            if current.lower() in name.lower()
-        ][:25]
+        return filter_choices(_STATUS_CHOICES, current)
     
     @list_reports.autocomplete('report_type')
     async def list_report_type_autocomplete(
@@ -366,20 +472,7 @@ class AdminReportsCog(commands.Cog):
         current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for report types in list command."""
-        report_types = [
-            ('User Behavior', 'user_behavior'),
-            ('Spam', 'spam'),
-            ('Harassment', 'harassment'),
-            ('Inappropriate Content', 'inappropriate_content'),
-            ('Technical Issue', 'technical_issue'),
-            ('Other', 'other')
-        ]
-        
-        return [
-            app_commands.Choice(name=name, value=value)
-            for name, value in report_types
-            if current.lower() in name.lower()
-        ][:25]
+        return filter_choices(_REPORT_TYPE_CHOICES, current)
     
     @app_commands.command(name="get_report", description="Get detailed information about a specific report")
     @app_commands.describe(report_id="ID of the report to view")
@@ -392,13 +485,9 @@ class AdminReportsCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            # Get report from database
+            # Get report from cache or database
             async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select
-                result = await session.execute(
-                    select(Report).where(Report.id == report_id)
-                )
-                report = result.scalar_one_or_none()
+                report = await self._fetch_report(session, report_id)
                 
                 if not report:
                     await interaction.followup.send(
@@ -423,7 +512,7 @@ class AdminReportsCog(commands.Cog):
             )
             
             embed.add_field(name="Status", value=report.status.title(), inline=True)
-            embed.add_field(name="Type", value=report.report_type.replace('_', ' ').title(), inline=True)
+            embed.add_field(name="Type", value=_type_display(report.report_type), inline=True)
             embed.add_field(name="Reporter", value=f"<@{report.reporter_id}> ({report.reporter_id})", inline=True)
             
             if report.reported_user_id:
@@ -458,14 +547,14 @@ class AdminReportsCog(commands.Cog):
     
     async def _notify_reporter(
         self,
-        report: Report,
+        report: Row,
         action: str,
         response: str,
         admin: discord.Member
     ):
         """Send notification to the reporter about report resolution."""
         try:
-            reporter = self.bot.get_user(report.reporter_id)
+            reporter = await self._get_user(report.reporter_id)
             if not reporter:
                 self.logger.warning(f"[admin_reports._notify_reporter] Reporter {report.reporter_id} not found")
                 return
@@ -497,7 +586,7 @@ class AdminReportsCog(commands.Cog):
                 timestamp=discord.utils.utcnow()
             )
             
-            embed.add_field(name="Report Type", value=report.report_type.replace('_', ' ').title(), inline=True)
+            embed.add_field(name="Report Type", value=_type_display(report.report_type), inline=True)
             embed.add_field(name="Status", value=action.title(), inline=True)
             
             if response:
@@ -526,7 +615,7 @@ class AdminReportsCog(commands.Cog):
     
     async def _send_admin_log(
         self,
-        report: Report,
+        report: Row,
         action: str,
         response: Optional[str],
         admin: discord.Member
@@ -550,7 +639,7 @@ class AdminReportsCog(commands.Cog):
                 timestamp=discord.utils.utcnow()
             )
             
-            embed.add_field(name="Type", value=report.report_type.replace('_', ' ').title(), inline=True)
+            embed.add_field(name="Type", value=_type_display(report.report_type), inline=True)
             embed.add_field(name="Reporter", value=f"<@{report.reporter_id}>", inline=True)
             embed.add_field(name="Admin", value=admin.mention, inline=True)
             
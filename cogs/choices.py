@@ -0,0 +1,22 @@
+"""
+Autocomplete Choices - Shared helpers for static slash command options
+
+Not a cog: admin cogs import these to prebuild their autocomplete options
+once and filter them by what the user has typed so far.
+"""
+
+from discord import app_commands
+
+
+def build_choices(*pairs: tuple[str, str]) -> tuple[tuple[str, app_commands.Choice[str]], ...]:
+    """Prebuild autocomplete choices, each paired with its lowercased name for matching."""
+    return tuple((name.lower(), app_commands.Choice(name=name, value=value)) for name, value in pairs)
+
+
+def filter_choices(
+    choices: tuple[tuple[str, app_commands.Choice[str]], ...],
+    current: str
+) -> list[app_commands.Choice[str]]:
+    """Choices whose name contains the typed text, capped at Discord's 25-option limit."""
+    current = current.lower()
+    return [choice for name, choice in choices if current in name][:25]
@@ -5,7 +5,6 @@ This cog provides admin commands for testing and debugging the activity scoring
 """
 
 import logging
-import os
 from datetime import datetime, timedelta
 
 import discord
@@ -40,9 +39,9 @@ class DebugCommandsCog(commands.Cog):
                 await interaction.followup.send("❌ Proposed category not found")
                 return
             
-            # Get report channel IDs to exclude
-            proposed_report_channel_id = int(os.getenv('PROPOSED_ACTIVITY_REPORT_CHANNEL_ID', '0'))
-            permanent_report_channel_id = int(os.getenv('PERMANENT_ACTIVITY_REPORT_CHANNEL_ID', '0'))
+            # Report channel IDs to exclude, parsed once from config at startup
+            proposed_report_channel_id = self.bot.proposed_activity_report_channel_id
+            permanent_report_channel_id = self.bot.permanent_activity_report_channel_id
             
             debug_info = []
             debug_info.append(f"**Debug Activity Scoring System**")
@@ -194,7 +193,8 @@ class DebugCommandsCog(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def backfill_stats(self, interaction: discord.Interaction, channel: discord.TextChannel = None, days: int = 7):
         """Backfill message statistics from recent channel history."""
-        await interaction.response.defer(ephemeral=True)
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
         
         try:
             if not hasattr(self.bot.db_manager, 'redis_stats'):
@@ -221,8 +221,8 @@ class DebugCommandsCog(commands.Cog):
                     channels_to_process.extend(permanent_category.text_channels)
                 
                 # Exclude report channels
-                proposed_report_channel_id = int(os.getenv('PROPOSED_ACTIVITY_REPORT_CHANNEL_ID', '0'))
-                permanent_report_channel_id = int(os.getenv('PERMANENT_ACTIVITY_REPORT_CHANNEL_ID', '0'))
+                proposed_report_channel_id = self.bot.proposed_activity_report_channel_id
+                permanent_report_channel_id = self.bot.permanent_activity_report_channel_id
                 
                 channels_to_process = [ch for ch in channels_to_process 
                                      if ch.id not in [proposed_report_channel_id, permanent_report_channel_id]]
@@ -271,8 +271,7 @@ class DebugCommandsCog(commands.Cog):
             # Trigger activity report update
             tasks_cog = self.bot.get_cog('BackgroundTasksCog')
             if tasks_cog:
-                await tasks_cog._update_proposed_activity_report()
-                await tasks_cog._update_permanent_activity_report()
+                await tasks_cog.update_activity_reports()
                 await interaction.followup.send("📊 Activity reports updated with new data.")
         
         except Exception as e:
@@ -373,7 +372,8 @@ class DebugCommandsCog(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def trigger_activity_report(self, interaction: discord.Interaction):
         """Manually trigger activity report update."""
-        await interaction.response.defer(ephemeral=True)
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
         
         try:
             # Get the background tasks cog
@@ -383,8 +383,7 @@ class DebugCommandsCog(commands.Cog):
                 return
             
             # Trigger the reports
-            await tasks_cog._update_proposed_activity_report()
-            await tasks_cog._update_permanent_activity_report()
+            await tasks_cog.update_activity_reports()
             
             await interaction.followup.send("✅ Activity reports updated")
             
@@ -409,7 +408,8 @@ class DebugCommandsCog(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def sync_commands(self, interaction: discord.Interaction):
         """Manually sync slash commands."""
-        await interaction.response.defer(ephemeral=True)
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
         
         try:
             synced = await self.bot.tree.sync()
@@ -6,15 +6,21 @@ statistics reporting, and data cleanup.
 """
 
 import logging
-import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import discord
 from discord.ext import commands, tasks
 
 from database.db_models import TrackedChannel, PersistentEmbed
 
+# Activity reports by category: (category ID attribute, report channel ID attribute, embed type, title)
+_ACTIVITY_REPORTS = {
+    'proposed': ('proposed_channel_category_id', 'proposed_activity_report_channel_id',
+                 'proposed_activity', "📊 Proposed Channels Activity Report"),
+    'permanent': ('permanent_channel_category_id', 'permanent_activity_report_channel_id',
+                  'permanent_activity', "📊 Permanent Channels Activity Report"),
+}
 
 class BackgroundTasksCog(commands.Cog):
     """Cog for background tasks and statistics reporting."""
@@ -39,8 +45,7 @@ class BackgroundTasksCog(commands.Cog):
             self.logger.info("[tasks.stats_report_task] Starting statistics update")
             
             # Update both proposed and permanent channel activity reports
-            await self._update_proposed_activity_report()
-            await self._update_permanent_activity_report()
+            await self.update_activity_reports()
             
             self.logger.info("[tasks.stats_report_task] Statistics update completed")
             
@@ -82,148 +87,86 @@ class BackgroundTasksCog(commands.Cog):
         """Wait for bot to be ready before starting cleanup task."""
         await self.bot.wait_until_ready()
     
-    async def _update_proposed_activity_report(self):
-        """Update the proposed channels activity report."""
+    async def update_activity_reports(self, which: Tuple[str, ...] = ('proposed', 'permanent')):
+        """
+        Update the activity reports for the given categories.
+        
+        Channel stats and persistent embed records for every requested report
+        are fetched together, then each report is rendered from that shared state.
+        """
         try:
-            # Get proposed channels report channel
-            report_channel_id = getattr(self.bot, 'proposed_activity_report_channel_id', None)
-            if not report_channel_id:
-                self.logger.warning("[tasks._update_proposed_activity_report] No proposed activity report channel configured")
-                return
-            
-            report_channel = self.bot.get_channel(report_channel_id)
-            if not report_channel:
-                self.logger.warning(f"[tasks._update_proposed_activity_report] Report channel not found: {report_channel_id}")
-                return
-            
-            # Get proposed category channels
-            proposed_category = self.bot.get_channel(self.bot.proposed_channel_category_id)
-            if not proposed_category:
-                self.logger.warning("[tasks._update_proposed_activity_report] Proposed category not found")
-                return
-            
-            self.logger.info(f"[tasks._update_proposed_activity_report] Found proposed category: {proposed_category.name} (ID: {proposed_category.id})")
-            self.logger.info(f"[tasks._update_proposed_activity_report] Text channels in category: {len(proposed_category.text_channels)}")
-            self.logger.debug(f"[tasks._update_proposed_activity_report] DatabaseManager redis_stats available: {hasattr(self.bot.db_manager, 'redis_stats')}")
-            if hasattr(self.bot.db_manager, 'redis_stats'):
-                self.logger.debug(f"[tasks._update_proposed_activity_report] redis_stats object: {self.bot.db_manager.redis_stats}")
-            
-            # Get report channel IDs to exclude from scoring
-            proposed_report_channel_id = int(os.getenv('PROPOSED_ACTIVITY_REPORT_CHANNEL_ID', '0'))
-            permanent_report_channel_id = int(os.getenv('PERMANENT_ACTIVITY_REPORT_CHANNEL_ID', '0'))
-            
-            # Calculate scores for all text channels in category (excluding report channels)
-            channel_scores = []
-            for channel in proposed_category.text_channels:
-                # Skip report channels
-                if channel.id in [proposed_report_channel_id, permanent_report_channel_id]:
-                    self.logger.debug(f"[tasks._update_proposed_activity_report] Skipping report channel: {channel.name} (ID: {channel.id})")
+            bot = self.bot
+            report_channel_ids = frozenset((
+                bot.proposed_activity_report_channel_id,
+                bot.permanent_activity_report_channel_id,
+            ))
+            
+            # Resolve each report's target channel and the channels it scores
+            reports = []
+            for category_type in which:
+                category_attr, report_attr, embed_type, title = _ACTIVITY_REPORTS[category_type]
+                
+                report_channel_id = getattr(bot, report_attr, None)
+                report_channel = bot.get_channel(report_channel_id) if report_channel_id else None
+                if not report_channel:
+                    self.logger.warning(f"[tasks.update_activity_reports] {category_type.title()} report channel not found: {report_channel_id}")
                     continue
-                    
-                self.logger.debug(f"[tasks._update_proposed_activity_report] Processing channel: {channel.name} (ID: {channel.id})")
                 
-                if hasattr(self.bot.db_manager, 'redis_stats'):
-                    try:
-                        score = await self.bot.db_manager.redis_stats.calculate_channel_score(channel.id)
-                        stats = await self.bot.db_manager.redis_stats.get_channel_stats(channel.id)
-                        recent_count = await self.bot.db_manager.redis_stats.get_recent_message_count(channel.id, 7)
-                        
-                        self.logger.info(f"[tasks._update_proposed_activity_report] Channel {channel.name}: score={score}, total={stats['total_messages']}, recent={recent_count}")
-                        
-                        channel_scores.append({
-                            'channel': channel,
-                            'score': score,
-                            'total_messages': stats['total_messages'],
-                            'recent_messages': recent_count
-                        })
-                    except Exception as e:
-                        self.logger.error(f"[tasks._update_proposed_activity_report] Error processing channel {channel.name}: {e}")
-                else:
-                    self.logger.warning("[tasks._update_proposed_activity_report] redis_stats not available")
-            
-            self.logger.info(f"[tasks._update_proposed_activity_report] Processed {len(channel_scores)} channels with scores")
-            
-            # Sort by score (highest first)
-            channel_scores.sort(key=lambda x: x['score'], reverse=True)
-            
-            # Create embed
-            embed = await self._create_activity_embed(
-                "📊 Proposed Channels Activity Report",
-                channel_scores,
-                "proposed"
-            )
-            
-            # Update or create persistent embed
-            await self._update_persistent_activity_embed(report_channel, embed, 'proposed_activity')
-            
-            self.logger.debug(f"[tasks._update_proposed_activity_report] Updated report for {len(channel_scores)} channels")
-            
-        except Exception as e:
-            self.logger.error(f"[tasks._update_proposed_activity_report] Error updating report: {e}", exc_info=True)
-    
-    async def _update_permanent_activity_report(self):
-        """Update the permanent channels activity report."""
-        try:
-            # Get permanent channels report channel
-            report_channel_id = getattr(self.bot, 'permanent_activity_report_channel_id', None)
-            if not report_channel_id:
-                self.logger.warning("[tasks._update_permanent_activity_report] No permanent activity report channel configured")
-                return
-            
-            report_channel = self.bot.get_channel(report_channel_id)
-            if not report_channel:
-                self.logger.warning(f"[tasks._update_permanent_activity_report] Report channel not found: {report_channel_id}")
-                return
+                category = bot.get_channel(getattr(bot, category_attr))
+                if not category:
+                    self.logger.warning(f"[tasks.update_activity_reports] {category_type.title()} category not found")
+                    continue
+                
+                # Report channels live in the tracked categories but are never scored
+                channels = [ch for ch in category.text_channels if ch.id not in report_channel_ids]
+                reports.append((category_type, embed_type, title, report_channel, channels))
             
-            # Get permanent category channels
-            permanent_category = self.bot.get_channel(self.bot.permanent_channel_category_id)
-            if not permanent_category:
-                self.logger.warning("[tasks._update_permanent_activity_report] Permanent category not found")
+            if not reports:
                 return
             
-            # Get report channel IDs to exclude from scoring
-            proposed_report_channel_id = int(os.getenv('PROPOSED_ACTIVITY_REPORT_CHANNEL_ID', '0'))
-            permanent_report_channel_id = int(os.getenv('PERMANENT_ACTIVITY_REPORT_CHANNEL_ID', '0'))
+            # Fetch stats for every scored channel across all reports at once
+            snapshots = {}
+            redis_stats = bot.redis_stats
+            if redis_stats is not None:
+                snapshots = await redis_stats.get_channels_snapshot_bulk(
+                    [ch.id for *_, channels in reports for ch in channels], 7
+                )
+            else:
+                self.logger.warning("[tasks.update_activity_reports] redis_stats not available")
             
-            # Calculate scores for all text channels in category (excluding report channels)
-            channel_scores = []
-            for channel in permanent_category.text_channels:
-                # Skip report channels
-                if channel.id in [proposed_report_channel_id, permanent_report_channel_id]:
-                    self.logger.debug(f"[tasks._update_permanent_activity_report] Skipping report channel: {channel.name} (ID: {channel.id})")
-                    continue
+            async with bot.db_manager.get_pg_session() as session:
+                from sqlalchemy import select
+                
+                # Load the persistent embed records for all reports in one query
+                result = await session.execute(
+                    select(PersistentEmbed).where(PersistentEmbed.embed_type.in_([r[1] for r in reports]))
+                )
+                persistent_embeds = {pe.embed_type: pe for pe in result.scalars()}
+                
+                for category_type, embed_type, title, report_channel, channels in reports:
+                    channel_scores = [
+                        {'channel': ch, **snapshots[ch.id]}
+                        for ch in channels if ch.id in snapshots
+                    ]
                     
-                if hasattr(self.bot.db_manager, 'redis_stats'):
-                    score = await self.bot.db_manager.redis_stats.calculate_channel_score(channel.id)
-                    stats = await self.bot.db_manager.redis_stats.get_channel_stats(channel.id)
-                    recent_count = await self.bot.db_manager.redis_stats.get_recent_message_count(channel.id, 7)
+                    if category_type == 'proposed':
+                        # Proposed channels are ranked by score (highest first)
+                        channel_scores.sort(key=lambda x: x['score'], reverse=True)
+                    else:
+                        # Permanent channels are ordered by creation date (most recent first)
+                        channel_scores.sort(key=lambda x: x['channel'].created_at, reverse=True)
                     
-                    self.logger.info(f"[tasks._update_permanent_activity_report] Channel {channel.name}: score={score}, total={stats['total_messages']}, recent={recent_count}")
+                    embed = await self._create_activity_embed(title, channel_scores, category_type)
+                    await self._update_persistent_activity_embed(
+                        session, persistent_embeds.get(embed_type), report_channel, embed, embed_type
+                    )
                     
-                    channel_scores.append({
-                        'channel': channel,
-                        'score': score,
-                        'total_messages': stats['total_messages'],
-                        'recent_messages': recent_count
-                    })
-            
-            # Sort by creation date (most recent first) for permanent channels
-            channel_scores.sort(key=lambda x: x['channel'].created_at, reverse=True)
-            
-            # Create embed
-            embed = await self._create_activity_embed(
-                "📊 Permanent Channels Activity Report", 
-                channel_scores,
-                "permanent"
-            )
-            
-            # Update or create persistent embed
-            await self._update_persistent_activity_embed(report_channel, embed, 'permanent_activity')
-            
-            self.logger.debug(f"[tasks._update_permanent_activity_report] Updated report for {len(channel_scores)} channels")
+                    self.logger.debug("[tasks.update_activity_reports] Updated %s report for %d channels", category_type, len(channel_scores))
+                
+                await session.commit()
             
         except Exception as e:
-            self.logger.error(f"[tasks._update_permanent_activity_report] Error updating report: {e}", exc_info=True)
+            self.logger.error(f"[tasks.update_activity_reports] Error updating reports: {e}", exc_info=True)
     
     async def _create_activity_embed(self, title: str, channel_scores: List[Dict], category_type: str) -> discord.Embed:
         """Create activity report embed."""
@@ -328,44 +271,36 @@ class BackgroundTasksCog(commands.Cog):
         
         return embed
     
-    async def _update_persistent_activity_embed(self, channel: discord.TextChannel, embed: discord.Embed, embed_type: str):
-        """Update or create a persistent activity embed."""
+    async def _update_persistent_activity_embed(self, session, persistent_embed: Optional[PersistentEmbed],
+                                                channel: discord.TextChannel, embed: discord.Embed, embed_type: str):
+        """Update or create a persistent activity embed; the caller commits the session."""
         try:
-            async with self.bot.db_manager.get_pg_session() as session:
-                from sqlalchemy import select
-                result = await session.execute(
-                    select(PersistentEmbed).where(PersistentEmbed.embed_type == embed_type)
-                )
-                persistent_embed = result.scalar_one_or_none()
+            if persistent_embed and persistent_embed.message_id:
+                # Update existing embed
+                try:
+                    message = await channel.fetch_message(persistent_embed.message_id)
+                    await message.edit(embed=embed)
+                    self.logger.debug(f"[tasks._update_persistent_activity_embed] Updated existing {embed_type} embed")
+                except discord.NotFound:
+                    # Message was deleted, create new one
+                    message = await channel.send(embed=embed)
+                    persistent_embed.message_id = message.id
+                    self.logger.info(f"[tasks._update_persistent_activity_embed] Recreated {embed_type} embed")
+            else:
+                # Create new embed
+                message = await channel.send(embed=embed)
                 
-                if persistent_embed and persistent_embed.message_id:
-                    # Update existing embed
-                    try:
-                        message = await channel.fetch_message(persistent_embed.message_id)
-                        await message.edit(embed=embed)
-                        self.logger.debug(f"[tasks._update_persistent_activity_embed] Updated existing {embed_type} embed")
-                    except discord.NotFound:
-                        # Message was deleted, create new one
-                        message = await channel.send(embed=embed)
-                        persistent_embed.message_id = message.id
-                        await session.commit()
-                        self.logger.info(f"[tasks._update_persistent_activity_embed] Recreated {embed_type} embed")
+                if not persistent_embed:
+                    persistent_embed = PersistentEmbed(
+                        embed_type=embed_type,
+                        channel_id=channel.id,
+                        message_id=message.id
+                    )
+                    session.add(persistent_embed)
                 else:
-                    # Create new embed
-                    message = await channel.send(embed=embed)
-                    
-                    if not persistent_embed:
-                        persistent_embed = PersistentEmbed(
-                            embed_type=embed_type,
-                            channel_id=channel.id,
-                            message_id=message.id
-                        )
-                        session.add(persistent_embed)
-                    else:
-                        persistent_embed.message_id = message.id
-                    
-                    await session.commit()
-                    self.logger.info(f"[tasks._update_persistent_activity_embed] Created new {embed_type} embed")
+                    persistent_embed.message_id = message.id
+                
+                self.logger.info(f"[tasks._update_persistent_activity_embed] Created new {embed_type} embed")
             
         except Exception as e:
             self.logger.error(f"[tasks._update_persistent_activity_embed] Error updating {embed_type} embed: {e}", exc_info=True)
@@ -180,6 +180,7 @@ class UserChannelProposalsCog(commands.Cog):
             session.add(proposal)
             await session.commit()
             await session.refresh(proposal)
+            self.bot.dispatch('proposals_changed')
             
             return proposal.proposal_id
     
@@ -101,6 +101,8 @@ class UserEmojiProposalsCog(commands.Cog):
                 await session.refresh(proposal)
                 proposal_id = proposal.proposal_id
             
+            self.bot.dispatch('proposals_changed')
+            
             # Send confirmation to user
             embed = discord.Embed(
                 title="✅ Emoji Proposed",
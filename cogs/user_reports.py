@@ -125,6 +125,8 @@ class UserReportsCog(commands.Cog):
                 await session.refresh(report)
                 report_id = report.id
             
+            self.bot.dispatch('reports_changed')
+            
             # Send confirmation to user
             embed = discord.Embed(
                 title="✅ Report Submitted",
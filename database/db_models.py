@@ -9,7 +9,7 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
@@ -22,6 +22,11 @@ class Proposal(Base):
     """Model for channel and emoji proposals."""
     
     __tablename__ = 'proposals'
+    __table_args__ = (
+        # list_proposals: newest first, optionally filtered by status and/or type
+        Index('ix_proposals_status_created', 'status', 'created_at'),
+        Index('ix_proposals_type_status_created', 'proposal_type', 'status', 'created_at'),
+    )
     
     proposal_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, nullable=False, index=True)
@@ -40,6 +45,12 @@ class Report(Base):
     """Model for user reports."""
     
     __tablename__ = 'reports'
+    __table_args__ = (
+        # list_reports: newest first, optionally filtered by status and/or type
+        Index('ix_reports_status_type_created', 'status', 'report_type', 'created_at'),
+        Index('ix_reports_type_created', 'report_type', 'created_at'),
+        Index('ix_reports_created', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     reporter_id = Column(BigInteger, nullable=False, index=True)  # User who submitted the report
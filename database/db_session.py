@@ -13,8 +13,7 @@ from typing import Optional
 
 import redis.asyncio as redis
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from .db_models import Base
 from .redis_client import RedisStatsManager
@@ -42,6 +41,12 @@ class DatabaseManager:
         self.db_port = int(os.getenv('DB_PORT', '5432'))
         self.db_name = os.getenv('DB_NAME', 'discord')
         self.db_user = os.getenv('DB_USER', 'discord')
+        # Connection pool sizing: pool_size connections are kept open, and up to
+        # max_overflow more are opened under bursts of concurrent commands
+        self.db_pool_size = int(os.getenv('DB_POOL_SIZE', '10'))
+        self.db_max_overflow = int(os.getenv('DB_MAX_OVERFLOW', '40'))
+        # Prepared statements kept per connection; slash commands repeat the same few queries
+        self.db_statement_cache_size = int(os.getenv('DB_STATEMENT_CACHE_SIZE', '1024'))
         
         # Redis configuration
         self.redis_host = os.getenv('REDIS_HOST', 'redis')
@@ -93,12 +98,22 @@ class DatabaseManager:
             self.pg_engine = create_async_engine(
                 database_url,
                 echo=False,  # Set to True for SQL debugging
+                pool_size=self.db_pool_size,
+                max_overflow=self.db_max_overflow,
+                pool_timeout=30,
                 pool_pre_ping=True,
-                pool_recycle=3600
+                pool_recycle=3600,
+                connect_args={
+                    'command_timeout': 60,
+                    'prepared_statement_cache_size': self.db_statement_cache_size
+                }
             )
             
-            # Create session factory
-            self.pg_session_factory = sessionmaker(
+            # Create session factory. Objects stay loaded after commit: cogs read them
+            # once the session has closed (e.g. review_proposal after updating a
+            # proposal), and an expired attribute would need a new round-trip, which
+            # an AsyncSession cannot do implicitly.
+            self.pg_session_factory = async_sessionmaker(
                 bind=self.pg_engine,
                 class_=AsyncSession,
                 expire_on_commit=False
@@ -145,6 +160,11 @@ class DatabaseManager:
             
             # Create all tables with current schema
             await conn.run_sync(Base.metadata.create_all)
+            
+            # create_all skips indexes on tables that already exist; add any that are missing
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    await conn.run_sync(index.create, checkfirst=True)
             self.logger.info("[database._handle_schema_updates] Database schema updated")
     
     async def _initialize_redis(self):
@@ -5,12 +5,69 @@ Helper functions for Redis operations including channel statistics tracking.
 """
 
 import logging
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import redis.asyncio as redis
 
 logger = logging.getLogger('redis_client')
 
+# Atomically replace a channel's stats with a first batch of messages.
+# KEYS: channel_stats hash, channel_activity sorted set
+# ARGV: message_id, timestamp pairs
+_INIT_AND_INGEST_LUA = """
+redis.call('UNLINK', KEYS[1], KEYS[2])
+local count = #ARGV / 2
+if count == 0 then
+    return 0
+end
+local last_ts = 0
+local zargs = {}
+for i = 1, #ARGV, 2 do
+    local ts = tonumber(ARGV[i + 1])
+    zargs[#zargs + 1] = ts
+    zargs[#zargs + 1] = ARGV[i]
+    if ts > last_ts then
+        last_ts = ts
+    end
+    -- Keep unpack() well under Lua's stack limit for large batches
+    if #zargs >= 1000 then
+        redis.call('ZADD', KEYS[2], unpack(zargs))
+        zargs = {}
+    end
+end
+if #zargs > 0 then
+    redis.call('ZADD', KEYS[2], unpack(zargs))
+end
+redis.call('HSET', KEYS[1], 'total_messages', count, 'last_message_timestamp', last_ts)
+return count
+"""
+
+# Raise a hash field to a new value, never lowering it.
+# KEYS: hash; ARGV: field, candidate value
+_HSET_MAX_LUA = """
+local candidate = tonumber(ARGV[2])
+local current = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+if candidate > current then
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+
+def _build_snapshot(stats: Dict[str, str], recent_count: int) -> Dict[str, float]:
+    """Build a channel snapshot from its stats hash and recent message count."""
+    total_messages = int(stats.get('total_messages', 0))
+    recent_count = int(recent_count)
+    return {
+        'total_messages': total_messages,
+        'last_message_timestamp': int(stats.get('last_message_timestamp', 0)),
+        'recent_messages': recent_count,
+        'score': (total_messages * 0.4) + (recent_count * 0.6)
+    }
+
+
 class RedisStatsManager:
     """Manages Redis operations for channel statistics."""
     
@@ -18,6 +75,9 @@ class RedisStatsManager:
         """Initialize with a Redis client."""
         self.redis_client = redis_client
         self.logger = logging.getLogger('redis_stats')
+        # Runs via EVALSHA, loading the script on first use
+        self._init_and_ingest_script = redis_client.register_script(_INIT_AND_INGEST_LUA)
+        self._hset_max_script = redis_client.register_script(_HSET_MAX_LUA)
     
     async def increment_channel_messages(self, channel_id: int, message_id: int, timestamp: int):
         """
@@ -49,6 +109,128 @@ class RedisStatsManager:
         except Exception as e:
             self.logger.error(f"[redis_stats.increment_channel_messages] Error updating channel {channel_id}: {e}")
     
+    async def increment_channel_messages_batch(self, items: List[Tuple[int, int, int]]):
+        """
+        Apply a batch of message increments in a single pipelined round-trip.
+        
+        Args:
+            items: List of (channel_id, message_id, timestamp) tuples
+        """
+        if not items:
+            return
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for channel_id, message_id, timestamp in items:
+                hash_key = f"channel_stats:{channel_id}"
+                pipe.hincrby(hash_key, "total_messages", 1)
+                pipe.hset(hash_key, "last_message_timestamp", timestamp)
+                pipe.zadd(f"channel_activity:{channel_id}", {str(message_id): timestamp})
+            await pipe.execute()
+            
+            self.logger.debug(f"[redis_stats.increment_channel_messages_batch] Applied {len(items)} message increments")
+            
+        except Exception as e:
+            self.logger.error(f"[redis_stats.increment_channel_messages_batch] Error applying {len(items)} increments: {e}")
+    
+    async def increment_channel_messages_bulk(self, channel_id: int, message_ids: Sequence[int], timestamps: Sequence[int]):
+        """
+        Apply many message increments for one channel in a single pipelined round-trip.
+        
+        Args:
+            channel_id: Discord channel ID
+            message_ids: Discord message IDs
+            timestamps: Unix timestamps, parallel to message_ids
+        """
+        if not message_ids:
+            return
+        
+        try:
+            hash_key = f"channel_stats:{channel_id}"
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hincrby(hash_key, "total_messages", len(message_ids))
+            # Replays walk history oldest-first; never rewind what the live path wrote.
+            # With a pipeline client the script call only queues an EVALSHA.
+            await self._hset_max_script(keys=[hash_key], args=["last_message_timestamp", max(timestamps)], client=pipe)
+            pipe.zadd(f"channel_activity:{channel_id}", dict(zip(map(str, message_ids), timestamps)))
+            await pipe.execute()
+            
+            self.logger.debug("[redis_stats.increment_channel_messages_bulk] Applied %d increments for channel %s", len(message_ids), channel_id)
+            
+        except Exception as e:
+            self.logger.error(f"[redis_stats.increment_channel_messages_bulk] Error updating channel {channel_id}: {e}")
+            raise
+    
+    async def init_and_ingest(self, channel_id: int, message_ids: Sequence[int], timestamps: Sequence[int]) -> int:
+        """
+        Atomically clear a channel's statistics and record a first batch of messages.
+        
+        Readers never observe the empty window between clearing and re-ingesting.
+        
+        Args:
+            channel_id: Discord channel ID
+            message_ids: Discord message IDs (may be empty to only clear)
+            timestamps: Unix timestamps, parallel to message_ids
+            
+        Returns:
+            Number of messages recorded
+        """
+        try:
+            args = [value for pair in zip(message_ids, timestamps) for value in pair]
+            count = await self._init_and_ingest_script(
+                keys=[f"channel_stats:{channel_id}", f"channel_activity:{channel_id}"],
+                args=args
+            )
+            
+            self.logger.debug("[redis_stats.init_and_ingest] Reset channel %s with %d messages", channel_id, count)
+            
+            return int(count)
+            
+        except Exception as e:
+            self.logger.error(f"[redis_stats.init_and_ingest] Error resetting channel {channel_id}: {e}")
+            raise
+    
+    async def merge_delta(self, channel_id: int, message_ids: Sequence[int], timestamps: Sequence[int]) -> int:
+        """
+        Merge caught-up messages into a channel's existing statistics.
+        
+        Messages already present in the activity set are not counted again, so
+        catching up over a range the live path has partly recorded is safe.
+        
+        Args:
+            channel_id: Discord channel ID
+            message_ids: Discord message IDs
+            timestamps: Unix timestamps, parallel to message_ids
+            
+        Returns:
+            Number of messages that were not already recorded
+        """
+        if not message_ids:
+            return 0
+        
+        try:
+            hash_key = f"channel_stats:{channel_id}"
+            added = await self.redis_client.zadd(
+                f"channel_activity:{channel_id}",
+                dict(zip(map(str, message_ids), timestamps))
+            )
+            
+            pipe = self.redis_client.pipeline(transaction=False)
+            if added:
+                pipe.hincrby(hash_key, "total_messages", added)
+            # Catch-up walks history oldest-first, so its newest message may still be
+            # older than what the live flusher has already recorded
+            await self._hset_max_script(keys=[hash_key], args=["last_message_timestamp", max(timestamps)], client=pipe)
+            await pipe.execute()
+            
+            self.logger.debug("[redis_stats.merge_delta] Merged %d new of %d messages for channel %s", added, len(message_ids), channel_id)
+            
+            return int(added)
+            
+        except Exception as e:
+            self.logger.error(f"[redis_stats.merge_delta] Error merging delta for channel {channel_id}: {e}")
+            raise
+    
     async def get_channel_stats(self, channel_id: int) -> Dict[str, int]:
         """
         Get channel statistics.
@@ -90,8 +272,6 @@ class RedisStatsManager:
             Count of recent messages
         """
         try:
-            import time
-            
             # Calculate timestamp for N days ago
             current_time = int(time.time())
             cutoff_time = current_time - (days * 24 * 60 * 60)
@@ -116,8 +296,6 @@ class RedisStatsManager:
             days: Number of days of history to keep
         """
         try:
-            import time
-            
             # Calculate timestamp for N days ago
             current_time = int(time.time())
             cutoff_time = current_time - (days * 24 * 60 * 60)
@@ -131,31 +309,81 @@ class RedisStatsManager:
         except Exception as e:
             self.logger.error(f"[redis_stats.cleanup_old_activity] Error cleaning up channel {channel_id}: {e}")
     
-    async def calculate_channel_score(self, channel_id: int) -> float:
+    async def get_channel_snapshot(self, channel_id: int, recent_days: int = 7) -> Dict[str, float]:
         """
-        Calculate activity score for a channel using the specified algorithm.
-        Score = (total_messages * 0.4) + (recent_7day_messages * 0.6)
+        Get channel statistics, recent message count and activity score in one round-trip.
         
         Args:
             channel_id: Discord channel ID
+            recent_days: Number of days counted as recent activity
             
         Returns:
-            Calculated activity score
+            Dictionary with total_messages, last_message_timestamp, recent_messages and score
         """
         try:
-            stats = await self.get_channel_stats(channel_id)
-            recent_count = await self.get_recent_message_count(channel_id, 7)
+            cutoff_time = int(time.time()) - (recent_days * 24 * 60 * 60)
             
-            total_messages = stats['total_messages']
-            score = (total_messages * 0.4) + (recent_count * 0.6)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hgetall(f"channel_stats:{channel_id}")
+            pipe.zcount(f"channel_activity:{channel_id}", cutoff_time, '+inf')
+            stats, recent_count = await pipe.execute()
             
-            self.logger.debug(f"[redis_stats.calculate_channel_score] Channel {channel_id}: total={total_messages}, recent={recent_count}, score={score}")
+            return _build_snapshot(stats, recent_count)
             
-            return score
+        except Exception as e:
+            self.logger.error(f"[redis_stats.get_channel_snapshot] Error getting snapshot for channel {channel_id}: {e}")
+            return _build_snapshot({}, 0)
+    
+    async def get_channels_snapshot_bulk(self, channel_ids: List[int], recent_days: int = 7) -> Dict[int, Dict[str, float]]:
+        """
+        Get snapshots for many channels in a single pipelined round-trip.
+        
+        Args:
+            channel_ids: Discord channel IDs
+            recent_days: Number of days counted as recent activity
+            
+        Returns:
+            Dictionary mapping channel ID to its snapshot (see get_channel_snapshot)
+        """
+        if not channel_ids:
+            return {}
+        
+        try:
+            cutoff_time = int(time.time()) - (recent_days * 24 * 60 * 60)
+            
+            pipe = self.redis_client.pipeline(transaction=False)
+            for channel_id in channel_ids:
+                pipe.hgetall(f"channel_stats:{channel_id}")
+                pipe.zcount(f"channel_activity:{channel_id}", cutoff_time, '+inf')
+            results = await pipe.execute()
+            
+            # Results alternate HGETALL, ZCOUNT per channel
+            return {
+                channel_id: _build_snapshot(stats, recent_count)
+                for channel_id, stats, recent_count in zip(channel_ids, results[::2], results[1::2])
+            }
             
         except Exception as e:
-            self.logger.error(f"[redis_stats.calculate_channel_score] Error calculating score for channel {channel_id}: {e}")
-            return 0.0
+            self.logger.error(f"[redis_stats.get_channels_snapshot_bulk] Error getting snapshots for {len(channel_ids)} channels: {e}")
+            return {channel_id: _build_snapshot({}, 0) for channel_id in channel_ids}
+    
+    async def calculate_channel_score(self, channel_id: int) -> float:
+        """
+        Calculate activity score for a channel using the specified algorithm.
+        Score = (total_messages * 0.4) + (recent_7day_messages * 0.6)
+        
+        Args:
+            channel_id: Discord channel ID
+            
+        Returns:
+            Calculated activity score
+        """
+        snapshot = await self.get_channel_snapshot(channel_id, 7)
+        
+        self.logger.debug("[redis_stats.calculate_channel_score] Channel %s: total=%s, recent=%s, score=%s",
+                          channel_id, snapshot['total_messages'], snapshot['recent_messages'], snapshot['score'])
+        
+        return snapshot['score']
     
     async def clear_channel_stats(self, channel_id: int):
         """